@@ -0,0 +1,58 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled helpers for the voice assistant language detector
+Build with `python setup.py build_ext --inplace`; app.voice_assistant falls
+back to its pure-Python versions when this module is not compiled
+"""
+
+from libc.string cimport memset
+
+
+cpdef dict score_languages(set tokens, dict indicator_sets):
+    """Count whole-word indicator hits per language, keeping only non-zero scores"""
+    cdef dict scores = {}
+    cdef Py_ssize_t score
+    for lang, indicator_set in indicator_sets.items():
+        score = len(tokens & indicator_set)
+        if score > 0:
+            scores[lang] = score
+    return scores
+
+
+cpdef dict score_patterns(str text_lower, dict indicator_patterns):
+    """Count distinct substring indicator hits per language, keeping only non-zero scores"""
+    cdef dict scores = {}
+    cdef Py_ssize_t score
+    for lang, pattern in indicator_patterns.items():
+        score = len(set(pattern.findall(text_lower)))
+        if score > 0:
+            scores[lang] = score
+    return scores
+
+
+cpdef Py_ssize_t script_index(str text, const unsigned char[:] blocks, Py_ssize_t language_count,
+                              Py_ssize_t decisive_index):
+    """Index of the script language owning most characters of text, or -1 if none
+
+    Any character of the decisive_index language returns that index at once
+    """
+    cdef Py_ssize_t counts[256]
+    cdef Py_ssize_t limit = blocks.shape[0]
+    cdef Py_ssize_t best = -1
+    cdef Py_ssize_t block, i
+    cdef unsigned char marker
+    cdef Py_UCS4 ch
+    memset(counts, 0, sizeof(counts))
+    for ch in text:
+        block = (<Py_ssize_t>ch) >> 4
+        if block < limit:
+            marker = blocks[block]
+            if marker:
+                if marker - 1 == decisive_index:
+                    return decisive_index
+                counts[marker - 1] += 1
+    # Strictly greater, so ties go to the script listed first
+    for i in range(language_count):
+        if counts[i] and (best < 0 or counts[i] > counts[best]):
+            best = i
+    return best
@@ -1,7 +1,8 @@
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from .triage_engine import TriageEngine, UrgencyLevel
 from .i18n_system import i18n
 
@@ -12,6 +13,7 @@ class ChatMessage:
     sender: str  # 'user' or 'bot'
     message: str
     message_type: str = 'text'  # 'text', 'triage_result', 'options'
+    is_emergency: bool = False
 
 @dataclass
 class ChatSession:
@@ -21,15 +23,20 @@ class ChatSession:
     current_state: str
     triage_result: Optional[dict] = None
     created_at: datetime = None
+    # (symptoms, language) of the last triage and its TriageResult, to skip repeat assessments
+    _last_triage: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
 
 class HealthcareChatbot:
+    # Least recently used sessions are dropped beyond this many
+    MAX_SESSIONS = 10000
+    
     def __init__(self):
         self.triage_engine = TriageEngine()
-        self.sessions: Dict[str, ChatSession] = {}
+        self.sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
         self.current_language = 'en'  # Default language
         
         # Conversation states
@@ -82,6 +89,8 @@ class HealthcareChatbot:
         )
         
         self.sessions[session_id] = session
+        while len(self.sessions) > self.MAX_SESSIONS:
+            self.sessions.popitem(last=False)
         
         # Add greeting messages in current language
         greeting_messages = self.get_greeting_messages()
@@ -106,7 +115,8 @@ class HealthcareChatbot:
         session.messages.append(chat_message)
         return chat_message
 
-    def add_bot_message(self, session_id: str, message: str, message_type: str = 'text') -> ChatMessage:
+    def add_bot_message(self, session_id: str, message: str, message_type: str = 'text',
+                        is_emergency: bool = False) -> ChatMessage:
         """Add a bot message to the session"""
         session = self.sessions.get(session_id)
         if not session:
@@ -117,7 +127,8 @@ class HealthcareChatbot:
             timestamp=datetime.now(),
             sender='bot',
             message=message,
-            message_type=message_type
+            message_type=message_type,
+            is_emergency=is_emergency
         )
         
         session.messages.append(chat_message)
@@ -132,6 +143,7 @@ class HealthcareChatbot:
         session = self.sessions.get(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
+        self.sessions.move_to_end(session_id)
         
         # Add user message
         self.add_user_message(session_id, user_input)
@@ -159,8 +171,13 @@ class HealthcareChatbot:
         # Acknowledge the input
         responses.append(self.add_bot_message(session_id, self.get_translated_message('symptom_acknowledge')))
         
-        # Perform triage assessment
-        triage_result = self.triage_engine.triage(symptoms)
+        # Perform triage assessment, unless this session just assessed the same input
+        triage_key = (symptoms, self.triage_engine.language)
+        if session._last_triage is not None and session._last_triage[0] == triage_key:
+            triage_result = session._last_triage[1]
+        else:
+            triage_result = self.triage_engine.triage(symptoms)
+            session._last_triage = (triage_key, triage_result)
         # Convert triage result to dict with enum values serialized
         session.triage_result = self._serialize_triage_result(triage_result)
         
@@ -168,10 +185,11 @@ class HealthcareChatbot:
         if triage_result.urgency == UrgencyLevel.EMERGENCY:
             # Emergency response
             for msg in self.get_emergency_messages():
-                responses.append(self.add_bot_message(session_id, msg))
+                responses.append(self.add_bot_message(session_id, msg, is_emergency=True))
             
             # Add specific emergency guidance
-            responses.append(self.add_bot_message(session_id, self.get_translated_message('emergency_services')))
+            responses.append(self.add_bot_message(session_id, self.get_translated_message('emergency_services'),
+                                                  is_emergency=True))
             
         else:
             # Non-emergency response
@@ -198,7 +216,8 @@ class HealthcareChatbot:
                 responses.append(self.add_bot_message(session_id, f"• {step}"))
         
         # Add helpful resources
-        responses.append(self.add_bot_message(session_id, self.get_helpful_resources(triage_result.urgency)))
+        responses.append(self.add_bot_message(session_id, self.get_helpful_resources(triage_result.urgency),
+                                              is_emergency=(triage_result.urgency == UrgencyLevel.EMERGENCY)))
         
         # Update state
         session.current_state = self.STATES['FOLLOW_UP']
@@ -265,11 +284,8 @@ class HealthcareChatbot:
     def _serialize_triage_result(self, triage_result) -> dict:
         """Convert triage result to JSON-serializable dictionary"""
         result_dict = asdict(triage_result)
-        # Convert enum to string value
-        if 'urgency' in result_dict and hasattr(result_dict['urgency'], 'value'):
-            result_dict['urgency'] = result_dict['urgency'].value
-        elif hasattr(triage_result, 'urgency') and hasattr(triage_result.urgency, 'value'):
-            result_dict['urgency'] = triage_result.urgency.value
+        # Store urgency as its string value so consumers never see the enum
+        result_dict['urgency'] = triage_result.urgency_str
         return result_dict
     
     def get_helpful_resources(self, urgency_level: UrgencyLevel) -> str:
@@ -305,4 +321,5 @@ class HealthcareChatbot:
 
     def get_all_sessions(self) -> List[Dict]:
         """Get summaries of all sessions for clinician dashboard"""
-        return [self.get_session_summary(sid) for sid in self.sessions.keys()]
+        # Snapshot the ids: process_user_input reorders the LRU, which would break live iteration
+        return [self.get_session_summary(sid) for sid in list(self.sessions)]
@@ -41,11 +41,12 @@ class MessagingIntegration:
             # Send bot responses back to WhatsApp
             for response in responses:
                 msg = twilio_response.message()
-                msg.body(response.message)
                 
                 # Add emergency indicators for urgent cases
-                if 'EMERGENCY' in response.message.upper():
+                if response.is_emergency:
                     msg.body(f"🚨 {response.message}")
+                else:
+                    msg.body(response.message)
             
             return str(twilio_response)
             
@@ -87,8 +88,9 @@ class MessagingIntegration:
 
     def get_or_create_session(self, phone_number: str) -> str:
         """Get existing session or create new one for phone number"""
-        if phone_number in self.user_sessions:
-            return self.user_sessions[phone_number]
+        session_id = self.user_sessions.get(phone_number)
+        if session_id is not None and self.chatbot.has_session(session_id):
+            return session_id
         
         # Create new session with phone number as user ID
         session_id = self.chatbot.create_session(user_id=f"phone_{phone_number}")
@@ -19,10 +19,16 @@ class TriageResult:
     recommendations: List[str]
     next_steps: List[str]
     red_flags: List[str]
+    
+    @property
+    def urgency_str(self) -> str:
+        """Urgency as its plain string value (e.g. 'self-care')"""
+        return self.urgency.value if isinstance(self.urgency, UrgencyLevel) else str(self.urgency)
 
 class TriageEngine:
     def __init__(self, language='en'):
         self.language = language
+        self._tr = i18n.translations.get(language, {})
         # Emergency red flags that always escalate to emergency
         self.red_flags = {
             'chest_pain': [
@@ -100,6 +106,9 @@ class TriageEngine:
                 'minor ache', 'slight discomfort'
             ]
         }
+        
+        # Built on first triage_batch call
+        self._keyword_index = None
 
     def extract_symptoms(self, text: str) -> List[str]:
         """Extract symptoms from natural language input"""
@@ -161,9 +170,16 @@ class TriageEngine:
     def set_language(self, language: str):
         """Set language for triage responses"""
         self.language = language
+        # Keep a direct reference to this language's table for hot-path lookups
+        self._tr = i18n.translations.get(language, {})
     
     def get_translated_text(self, key: str, **kwargs) -> str:
         """Get translated text for current language"""
+        if not kwargs:
+            translation = self._tr.get(key)
+            if translation:
+                return translation
+        # Formatting and missing keys go through the full i18n fallback chain
         return i18n.get_translation(key, self.language, **kwargs)
 
     def check_red_flags(self, symptoms_text: str) -> Tuple[bool, List[str]]:
@@ -289,6 +305,54 @@ class TriageEngine:
             red_flags=red_flags
         )
 
+    def _build_keyword_index(self):
+        """Flatten the keyword tables into priority-ordered sets for batch triage"""
+        red_flags = [flag.lower() for flags in self.red_flags.values() for flag in flags]
+        levels = [(frozenset(red_flags), UrgencyLevel.EMERGENCY, 'condition_emergency', 0.9)]
+        for conditions, urgency, prefix, confidence in (
+            (self.urgent_conditions, UrgencyLevel.URGENT, 'condition_urgent_', 0.8),
+            (self.outpatient_conditions, UrgencyLevel.OUTPATIENT, 'condition_outpatient_', 0.7),
+            (self.self_care_conditions, UrgencyLevel.SELF_CARE, 'condition_selfcare_', 0.6),
+        ):
+            for condition, keywords in conditions.items():
+                levels.append((frozenset(k.lower() for k in keywords), urgency,
+                               f'{prefix}{condition}', confidence))
+        
+        keywords = tuple(set().union(*(level[0] for level in levels)))
+        return keywords, red_flags, levels
+
+    def triage_batch(self, texts: List[str]) -> List[TriageResult]:
+        """Triage many inputs at once, scanning each text a single time for all keywords"""
+        if self._keyword_index is None:
+            self._keyword_index = self._build_keyword_index()
+        keywords, red_flag_order, levels = self._keyword_index
+        
+        results = []
+        for text in (text.lower() for text in texts):
+            matched = {keyword for keyword in keywords if keyword in text}
+            red_flags = [flag for flag in red_flag_order if flag in matched]
+            
+            # Same priority order as assess_urgency: first level with a hit wins
+            for level_keywords, urgency, condition_key, confidence in levels:
+                if not level_keywords.isdisjoint(matched):
+                    break
+            else:
+                urgency, condition_key, confidence = UrgencyLevel.OUTPATIENT, 'condition_general', 0.5
+            
+            condition = self.get_translated_text(condition_key)
+            recommendations, next_steps = self.generate_recommendations(urgency, condition, red_flags)
+            
+            results.append(TriageResult(
+                urgency=urgency,
+                condition=condition,
+                confidence=confidence,
+                recommendations=recommendations,
+                next_steps=next_steps,
+                red_flags=red_flags
+            ))
+        
+        return results
+
 # Test the engine with example scenarios
 if __name__ == "__main__":
     engine = TriageEngine()
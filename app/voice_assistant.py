@@ -4,98 +4,542 @@ Provides speech-to-text and text-to-speech capabilities for the healthcare triag
 Supports multiple languages to assist illiterate users and bridge language barriers
 """
 
+import asyncio
+import functools
+import hashlib
 import json
+import logging
+import os
+import pickle
 import re
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from enum import Enum
+import sys
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, Dict, List, Mapping, Optional, Pattern, Tuple
+from dataclasses import asdict, dataclass, field
+from enum import IntEnum
+from multiprocessing import resource_tracker, shared_memory
+from xml.sax.saxutils import escape as _xml_escape
 
-class SupportedLanguage(Enum):
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import redis
+    from redis import RedisError
+except ImportError:
+    redis = None  # Synthesis cache stays in-process only
+    RedisError = OSError  # Never raised without redis-py, since no client can be connected
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Speech corrections use a regex alternation instead
+
+try:
+    from .i18n_system import WorldLanguages
+except ImportError:
+    WorldLanguages = None  # Fall back to the built-in language names
+
+logger = logging.getLogger(__name__)
+
+class SupportedLanguage(IntEnum):
+    """Supported languages; the int value indexes per-language tables, `code` is the ISO code"""
+    
+    def __new__(cls, index: int, code: str):
+        member = int.__new__(cls, index)
+        member._value_ = index
+        member.code = code
+        return member
+    
     # Major World Languages (Top tier - full voice support)
-    ENGLISH = "en"
-    SPANISH = "es" 
-    HINDI = "hi"
-    FRENCH = "fr"
-    PORTUGUESE = "pt"
-    ARABIC = "ar"
-    CHINESE = "zh"
-    BENGALI = "bn"
-    RUSSIAN = "ru"
-    GERMAN = "de"
+    ENGLISH = 0, "en"
+    SPANISH = 1, "es"
+    HINDI = 2, "hi"
+    FRENCH = 3, "fr"
+    PORTUGUESE = 4, "pt"
+    ARABIC = 5, "ar"
+    CHINESE = 6, "zh"
+    BENGALI = 7, "bn"
+    RUSSIAN = 8, "ru"
+    GERMAN = 9, "de"
     
     # Extended Language Support (Tier 2 - Web Speech API support)
-    JAPANESE = "ja"
-    KOREAN = "ko"
-    ITALIAN = "it"
-    DUTCH = "nl"
-    TURKISH = "tr"
-    POLISH = "pl"
-    THAI = "th"
-    VIETNAMESE = "vi"
-    SWEDISH = "sv"
-    NORWEGIAN = "no"
-    DANISH = "da"
-    FINNISH = "fi"
-    HEBREW = "he"
+    JAPANESE = 10, "ja"
+    KOREAN = 11, "ko"
+    ITALIAN = 12, "it"
+    DUTCH = 13, "nl"
+    TURKISH = 14, "tr"
+    POLISH = 15, "pl"
+    THAI = 16, "th"
+    VIETNAMESE = 17, "vi"
+    SWEDISH = 18, "sv"
+    NORWEGIAN = 19, "no"
+    DANISH = 20, "da"
+    FINNISH = 21, "fi"
+    HEBREW = 22, "he"
     
     # Regional Languages (Tier 3 - Basic voice support)
-    INDONESIAN = "id"
-    MALAY = "ms"
-    FILIPINO = "tl"
-    CZECH = "cs"
-    HUNGARIAN = "hu"
-    ROMANIAN = "ro"
-    BULGARIAN = "bg"
-    CROATIAN = "hr"
-    SLOVAK = "sk"
-    SLOVENIAN = "sl"
-    UKRAINIAN = "uk"
+    INDONESIAN = 23, "id"
+    MALAY = 24, "ms"
+    FILIPINO = 25, "tl"
+    CZECH = 26, "cs"
+    HUNGARIAN = 27, "hu"
+    ROMANIAN = 28, "ro"
+    BULGARIAN = 29, "bg"
+    CROATIAN = 30, "hr"
+    SLOVAK = 31, "sk"
+    SLOVENIAN = 32, "sl"
+    UKRAINIAN = 33, "uk"
     
     # South Asian Languages
-    TAMIL = "ta"
-    TELUGU = "te"
-    GUJARATI = "gu"
-    PUNJABI = "pa"
-    MARATHI = "mr"
-    KANNADA = "kn"
-    MALAYALAM = "ml"
-    URDU = "ur"
-    NEPALI = "ne"
-    SINHALA = "si"
+    TAMIL = 34, "ta"
+    TELUGU = 35, "te"
+    GUJARATI = 36, "gu"
+    PUNJABI = 37, "pa"
+    MARATHI = 38, "mr"
+    KANNADA = 39, "kn"
+    MALAYALAM = 40, "ml"
+    URDU = 41, "ur"
+    NEPALI = 42, "ne"
+    SINHALA = 43, "si"
     
     # Middle Eastern & Central Asian
-    PERSIAN = "fa"
-    KURDISH = "ku"
-    AZERBAIJANI = "az"
-    ARMENIAN = "hy"
-    GEORGIAN = "ka"
-    KAZAKH = "kk"
-    UZBEK = "uz"
+    PERSIAN = 44, "fa"
+    KURDISH = 45, "ku"
+    AZERBAIJANI = 46, "az"
+    ARMENIAN = 47, "hy"
+    GEORGIAN = 48, "ka"
+    KAZAKH = 49, "kk"
+    UZBEK = 50, "uz"
     
     # African Languages
-    SWAHILI = "sw"
-    AMHARIC = "am"
-    YORUBA = "yo"
-    IGBO = "ig"
-    HAUSA = "ha"
+    SWAHILI = 51, "sw"
+    AMHARIC = 52, "am"
+    YORUBA = 53, "yo"
+    IGBO = 54, "ig"
+    HAUSA = 55, "ha"
     
     # Additional European Languages
-    CATALAN = "ca"
-    BASQUE = "eu"
-    GALICIAN = "gl"
-    WELSH = "cy"
-    IRISH = "ga"
-    ICELANDIC = "is"
-    ESTONIAN = "et"
-    LATVIAN = "lv"
-    LITHUANIAN = "lt"
-
-@dataclass
+    CATALAN = 56, "ca"
+    BASQUE = 57, "eu"
+    GALICIAN = 58, "gl"
+    WELSH = 59, "cy"
+    IRISH = 60, "ga"
+    ICELANDIC = 61, "is"
+    ESTONIAN = 62, "et"
+    LATVIAN = 63, "lv"
+    LITHUANIAN = 64, "lt"
+
+_LANGUAGES_BY_CODE: Dict[str, SupportedLanguage] = {lang.code: lang for lang in SupportedLanguage}
+
+@dataclass(frozen=True, slots=True)
 class VoiceConfig:
     language: SupportedLanguage
     voice_name: str
     speech_rate: float = 1.0
     speech_pitch: float = 1.0
+    ssml_template: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Only the utterance varies per request; the {TEXT} slot is filled by _build_ssml
+        object.__setattr__(self, 'ssml_template', (
+            f'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{self.voice_name}">'
+            f'<prosody rate="{self.speech_rate}" pitch="{self.speech_pitch}">{{TEXT}}</prosody>'
+            f'</speak>'
+        ))
+
+@dataclass(slots=True)
+class VoiceResult:
+    """Processed voice input ready for triage"""
+    original_text: str
+    normalized_text: str
+    english_text: str
+    detected_language: str
+    language_confidence: float = 0.8  # Simple confidence score
+
+_WORD_PATTERN = re.compile(r"\w+")
+# ASCII letters plus the non-ASCII characters that match them case-insensitively
+# (İ, ı, ſ and the Kelvin sign); response phrase matching needs one of these
+_ENGLISH_LETTER = re.compile(r"[A-Za-z\u0130\u0131\u017f\u212a]")
+# Sentence ends: Latin/Devanagari punctuation needs trailing space, CJK full-width marks do not
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?।])\s+|(?<=[。！？])\s*")
+
+# Unicode blocks whose script identifies a supported language on its own.
+# Shared scripts map to the language with the most speakers.
+_SCRIPT_RANGES: Tuple[Tuple[int, int, SupportedLanguage], ...] = (
+    (0x0400, 0x04FF, SupportedLanguage.RUSSIAN),     # Cyrillic
+    (0x0530, 0x058F, SupportedLanguage.ARMENIAN),
+    (0x0590, 0x05FF, SupportedLanguage.HEBREW),
+    (0x0600, 0x06FF, SupportedLanguage.ARABIC),
+    (0x0900, 0x097F, SupportedLanguage.HINDI),       # Devanagari
+    (0x0980, 0x09FF, SupportedLanguage.BENGALI),
+    (0x0A00, 0x0A7F, SupportedLanguage.PUNJABI),     # Gurmukhi
+    (0x0A80, 0x0AFF, SupportedLanguage.GUJARATI),
+    (0x0B80, 0x0BFF, SupportedLanguage.TAMIL),
+    (0x0C00, 0x0C7F, SupportedLanguage.TELUGU),
+    (0x0C80, 0x0CFF, SupportedLanguage.KANNADA),
+    (0x0D00, 0x0D7F, SupportedLanguage.MALAYALAM),
+    (0x0D80, 0x0DFF, SupportedLanguage.SINHALA),
+    (0x0E00, 0x0E7F, SupportedLanguage.THAI),
+    (0x10A0, 0x10FF, SupportedLanguage.GEORGIAN),
+    (0x1200, 0x137F, SupportedLanguage.AMHARIC),     # Ethiopic
+    (0x3040, 0x30FF, SupportedLanguage.JAPANESE),    # Hiragana and Katakana
+    (0x4E00, 0x9FFF, SupportedLanguage.CHINESE),     # CJK Unified Ideographs
+    (0xAC00, 0xD7AF, SupportedLanguage.KOREAN),      # Hangul
+)
+
+def _char_class(ranges) -> str:
+    """Build a regex character class from (low, high) codepoint pairs"""
+    return "[" + "".join(f"{chr(low)}-{chr(high)}" for low, high in ranges) + "]"
+
+_NON_LATIN_PATTERN = re.compile(_char_class((low, high) for low, high, _ in _SCRIPT_RANGES))
+_SCRIPT_LANGUAGES: Tuple[SupportedLanguage, ...] = tuple(dict.fromkeys(lang for _, _, lang in _SCRIPT_RANGES))
+
+# Every script range starts and ends on a 16-codepoint boundary, so codepoint >> 4
+# indexes a flat table: 0 for no script, otherwise 1 + index into _SCRIPT_LANGUAGES
+def _build_script_blocks() -> bytes:
+    blocks = bytearray((_SCRIPT_RANGES[-1][1] >> 4) + 1)
+    for low, high, lang in _SCRIPT_RANGES:
+        marker = _SCRIPT_LANGUAGES.index(lang) + 1
+        blocks[low >> 4:(high >> 4) + 1] = bytes([marker]) * ((high - low + 1) >> 4)
+    return bytes(blocks)
+
+_SCRIPT_BLOCKS = _build_script_blocks()
+
+# Kana only occurs in Japanese, which also writes most content words in CJK
+# ideographs, so any kana decides the language regardless of the majority
+_KANA_PATTERN = re.compile(r"[\u3040-\u30ff]")
+_KANA_INDEX = _SCRIPT_LANGUAGES.index(SupportedLanguage.JAPANESE)
+
+# Per language, every script character that belongs to some other language
+_OTHER_SCRIPT_PATTERNS: Dict[SupportedLanguage, Pattern] = {
+    lang: re.compile(_char_class((low, high) for low, high, owner in _SCRIPT_RANGES if owner != lang))
+    for lang in _SCRIPT_LANGUAGES
+}
+
+def _score_languages(tokens, indicator_sets) -> Dict[SupportedLanguage, int]:
+    """Count whole-word indicator hits per language, keeping only non-zero scores"""
+    scores = {}
+    for lang, indicator_set in indicator_sets.items():
+        score = len(tokens & indicator_set)
+        if score > 0:
+            scores[lang] = score
+    return scores
+
+def _score_patterns(text_lower: str, indicator_patterns) -> Dict[SupportedLanguage, int]:
+    """Count distinct substring indicator hits per language, keeping only non-zero scores"""
+    scores = {}
+    for lang, pattern in indicator_patterns.items():
+        score = len(set(pattern.findall(text_lower)))
+        if score > 0:
+            scores[lang] = score
+    return scores
+
+# Prefer the compiled scorers when the optional extension has been built
+try:
+    from ._voice_fast import score_languages as _score_languages, score_patterns as _score_patterns
+except ImportError:
+    pass
+
+def _detect_script(text: str) -> Optional[SupportedLanguage]:
+    """Return Japanese if any kana is present, else the language owning most non-Latin script characters"""
+    first = _NON_LATIN_PATTERN.search(text)
+    if first is None:
+        return None
+    
+    # Most input is in a single script: if nothing from another script follows
+    # the first hit, that script wins without counting characters
+    first_language = _SCRIPT_LANGUAGES[_SCRIPT_BLOCKS[ord(first.group()) >> 4] - 1]
+    if _OTHER_SCRIPT_PATTERNS[first_language].search(text, first.start()) is None:
+        return first_language
+    
+    if _KANA_PATTERN.search(text, first.start()) is not None:
+        return SupportedLanguage.JAPANESE
+    
+    # Mixed scripts: one scan collects the script characters, then each distinct
+    # character is credited to its language through the block table
+    counts = [0] * len(_SCRIPT_LANGUAGES)
+    for char, count in Counter(_NON_LATIN_PATTERN.findall(text, first.start())).items():
+        counts[_SCRIPT_BLOCKS[ord(char) >> 4] - 1] += count
+    # Ties go to the script listed first, as max() keeps the first maximum
+    return _SCRIPT_LANGUAGES[counts.index(max(counts))]
+
+try:
+    from ._voice_fast import script_index as _script_index
+except ImportError:
+    pass
+else:
+    def _detect_script(text: str) -> Optional[SupportedLanguage]:
+        """Return Japanese if any kana is present, else the language owning most non-Latin script characters"""
+        # The compiled scan counts every character through _SCRIPT_BLOCKS in one native pass
+        index = _script_index(text, _SCRIPT_BLOCKS, len(_SCRIPT_LANGUAGES), _KANA_INDEX)
+        return _SCRIPT_LANGUAGES[index] if index >= 0 else None
+
+# Translation mappings for medical terms ship as JSON and are parsed on a
+# background thread at import so the work overlaps the rest of app startup
+_TRANSLATIONS_PATH = Path(__file__).parent / "data" / "translations.json"
+_TRANSLATIONS: Optional[Dict[str, Dict[str, str]]] = None
+
+def _preload_translations():
+    """Parse the packaged translation table into _TRANSLATIONS"""
+    global _TRANSLATIONS
+    _TRANSLATIONS = _json_loads(_TRANSLATIONS_PATH.read_bytes())
+
+_preload_thread = threading.Thread(target=_preload_translations, name="translations-preload", daemon=True)
+_preload_thread.start()
+
+def _load_translations() -> Dict[str, Dict[str, str]]:
+    """Return the translation table, waiting for the background preload if needed"""
+    _preload_thread.join()
+    if _TRANSLATIONS is None:
+        # The preload failed; load synchronously so the error surfaces here
+        _preload_translations()
+    return _TRANSLATIONS
+
+def _build_language_tables(translations_table: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """Transpose the key -> language table to language -> key, with fallbacks resolved"""
+    # English (or the key itself) fills any gap, so lookups need no fallback logic
+    english = {
+        key: translations.get("en") or key for key, translations in translations_table.items()
+    }
+    codes = {code for translations in translations_table.values() for code in translations}
+    
+    # Interned codes let dict probes from enum codes hit on identity
+    tables = {sys.intern(code): {} for code in sorted(codes)}
+    for key, translations in translations_table.items():
+        for code, table in tables.items():
+            table[key] = translations.get(code) or english[key]
+    tables.setdefault("en", english)
+    return tables
+
+# Voice settings for each supported language, indexed by SupportedLanguage
+_VOICE_CONFIGS: Tuple[VoiceConfig, ...] = (
+    # Tier 1: Major World Languages (Premium voice quality)
+    VoiceConfig(
+        SupportedLanguage.ENGLISH, "en-US", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.SPANISH, "es-ES", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.HINDI, "hi-IN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.FRENCH, "fr-FR", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.PORTUGUESE, "pt-BR", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.ARABIC, "ar-SA", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.CHINESE, "zh-CN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.BENGALI, "bn-IN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.RUSSIAN, "ru-RU", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.GERMAN, "de-DE", speech_rate=0.9
+    ),
+    
+    # Tier 2: Extended Language Support
+    VoiceConfig(
+        SupportedLanguage.JAPANESE, "ja-JP", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.KOREAN, "ko-KR", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.ITALIAN, "it-IT", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.DUTCH, "nl-NL", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.TURKISH, "tr-TR", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.POLISH, "pl-PL", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.THAI, "th-TH", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.VIETNAMESE, "vi-VN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.SWEDISH, "sv-SE", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.NORWEGIAN, "no-NO", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.DANISH, "da-DK", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.FINNISH, "fi-FI", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.HEBREW, "he-IL", speech_rate=0.8
+    ),
+    
+    # Tier 3: Regional Languages (Basic voice support)
+    VoiceConfig(
+        SupportedLanguage.INDONESIAN, "id-ID", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.MALAY, "ms-MY", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.FILIPINO, "tl-PH", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.CZECH, "cs-CZ", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.HUNGARIAN, "hu-HU", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.ROMANIAN, "ro-RO", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.BULGARIAN, "bg-BG", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.CROATIAN, "hr-HR", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.SLOVAK, "sk-SK", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.SLOVENIAN, "sl-SI", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.UKRAINIAN, "uk-UA", speech_rate=0.9
+    ),
+    
+    # South Asian Languages
+    VoiceConfig(
+        SupportedLanguage.TAMIL, "ta-IN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.TELUGU, "te-IN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.GUJARATI, "gu-IN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.PUNJABI, "pa-IN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.MARATHI, "mr-IN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.KANNADA, "kn-IN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.MALAYALAM, "ml-IN", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.URDU, "ur-PK", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.NEPALI, "ne-NP", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.SINHALA, "si-LK", speech_rate=0.8
+    ),
+    
+    # Middle Eastern & Central Asian Languages
+    VoiceConfig(
+        SupportedLanguage.PERSIAN, "fa-IR", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.KURDISH, "ku-IQ", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.AZERBAIJANI, "az-AZ", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.ARMENIAN, "hy-AM", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.GEORGIAN, "ka-GE", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.KAZAKH, "kk-KZ", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.UZBEK, "uz-UZ", speech_rate=0.9
+    ),
+    
+    # African Languages (using available regional codes)
+    VoiceConfig(
+        SupportedLanguage.SWAHILI, "sw-KE", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.AMHARIC, "am-ET", speech_rate=0.8
+    ),
+    VoiceConfig(
+        SupportedLanguage.YORUBA, "yo-NG", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.IGBO, "ig-NG", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.HAUSA, "ha-NG", speech_rate=0.9
+    ),
+    
+    # Additional European Languages
+    VoiceConfig(
+        SupportedLanguage.CATALAN, "ca-ES", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.BASQUE, "eu-ES", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.GALICIAN, "gl-ES", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.WELSH, "cy-GB", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.IRISH, "ga-IE", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.ICELANDIC, "is-IS", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.ESTONIAN, "et-EE", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.LATVIAN, "lv-LV", speech_rate=0.9
+    ),
+    VoiceConfig(
+        SupportedLanguage.LITHUANIAN, "lt-LT", speech_rate=0.9
+    ),
+)
+
+# The per-language part of every voice response, built once and indexed like _VOICE_CONFIGS
+_VOICE_SETTINGS: Tuple[Dict[str, object], ...] = tuple(
+    {
+        "language": config.language.code,
+        "voice_name": config.voice_name,
+        "speech_rate": config.speech_rate,
+        "speech_pitch": config.speech_pitch,
+    }
+    for config in _VOICE_CONFIGS
+)
 
 class LanguageTranslator:
     """Handles translation between different languages for voice input/output"""
@@ -103,409 +547,396 @@ class LanguageTranslator:
     def __init__(self):
         # Simple translation dictionary for medical terms and phrases
         # In production, this would use Google Translate API or similar service
-        self.translations = self._load_translations()
+        self.translations = _load_translations()
+        # _build_language_tables fills gaps with the English text (or the key itself)
+        self._by_lang = _build_language_tables(self.translations)
+        # Casefolded once here, like normalized speech input, so matching never folds table entries per call
+        self._translations_folded = {
+            key: {lang: text.casefold() for lang, text in translations.items()}
+            for key, translations in self.translations.items()
+        }
+        self._source_index = self._build_source_index()
+        self._response_pattern, self._response_lookups = self._build_response_translator()
         
-    def _load_translations(self) -> Dict[str, Dict[str, str]]:
-        """Load translation mappings for medical terms"""
-        return {
-            # Emergency phrases
-            "emergency": {
-                "en": "This is a medical emergency",
-                "es": "Esta es una emergencia médica",
-                "hi": "यह एक चिकित्सा आपातकाल है",
-                "fr": "C'est une urgence médicale",
-                "pt": "Esta é uma emergência médica",
-                "ar": "هذه حالة طبية طارئة",
-                "zh": "这是医疗紧急情况",
-                "bn": "এটি একটি চিকিৎসা জরুরী অবস্থা",
-                "ru": "Это неотложная медицинская помощь",
-                "de": "Dies ist ein medizinischer Notfall"
-            },
-            "call_emergency": {
-                "en": "Call emergency services immediately",
-                "es": "Llame a los servicios de emergencia inmediatamente",
-                "hi": "तुरंत आपातकालीन सेवाओं को कॉल करें",
-                "fr": "Appelez immédiatement les services d'urgence",
-                "pt": "Ligue para os serviços de emergência imediatamente",
-                "ar": "اتصل بخدمات الطوارئ على الفور",
-                "zh": "立即呼叫紧急服务",
-                "bn": "অবিলম্বে জরুরী সেবায় কল করুন",
-                "ru": "Немедленно вызовите службу экстренного реагирования",
-                "de": "Rufen Sie sofort den Notdienst an"
-            },
-            # Common symptoms
-            "chest_pain": {
-                "en": "chest pain",
-                "es": "dolor en el pecho",
-                "hi": "सीने में दर्द",
-                "fr": "douleur thoracique",
-                "pt": "dor no peito",
-                "ar": "ألم في الصدر",
-                "zh": "胸痛",
-                "bn": "বুকে ব্যথা",
-                "ru": "боль в груди",
-                "de": "Brustschmerzen"
-            },
-            "difficulty_breathing": {
-                "en": "difficulty breathing",
-                "es": "dificultad para respirar",
-                "hi": "सांस लेने में कठिनाई",
-                "fr": "difficulté à respirer",
-                "pt": "dificuldade para respirar", 
-                "ar": "صعوبة في التنفس",
-                "zh": "呼吸困难",
-                "bn": "শ্বাসকষ্ট",
-                "ru": "затрудненное дыхание",
-                "de": "Atembeschwerden"
-            },
-            "fever": {
-                "en": "fever",
-                "es": "fiebre", 
-                "hi": "बुखार",
-                "fr": "fièvre",
-                "pt": "febre",
-                "ar": "حمى",
-                "zh": "发烧",
-                "bn": "জ্বর",
-                "ru": "лихорадка",
-                "de": "Fieber"
-            },
-            "headache": {
-                "en": "headache",
-                "es": "dolor de cabeza",
-                "hi": "सिरदर्द",
-                "fr": "mal de tête",
-                "pt": "dor de cabeça",
-                "ar": "صداع",
-                "zh": "头痛",
-                "bn": "মাথাব্যথা",
-                "ru": "головная боль",
-                "de": "Kopfschmerzen"
-            },
-            # Greetings and responses
-            "hello": {
-                "en": "Hello! I'm your healthcare assistant. Please describe your symptoms.",
-                "es": "¡Hola! Soy tu asistente de salud. Por favor describe tus síntomas.",
-                "hi": "नमस्ते! मैं आपका स्वास्थ्य सहायक हूं। कृपया अपने लक्षणों का वर्णन करें।",
-                "fr": "Bonjour! Je suis votre assistant de santé. Veuillez décrire vos symptômes.",
-                "pt": "Olá! Sou seu assistente de saúde. Por favor, descreva seus sintomas.",
-                "ar": "مرحبا! أنا مساعدك الصحي. يرجى وصف الأعراض الخاصة بك.",
-                "zh": "您好！我是您的健康助手。请描述您的症状。",
-                "bn": "হ্যালো! আমি আপনার স্বাস্থ্য সহায়ক। দয়া করে আপনার লক্ষণগুলি বর্ণনা করুন।",
-                "ru": "Привет! Я ваш помощник по здравоохранению. Пожалуйста, опишите свои симптомы.",
-                "de": "Hallo! Ich bin Ihr Gesundheitsassistent. Bitte beschreiben Sie Ihre Symptome."
-            },
-            "self_care": {
-                "en": "Your symptoms appear mild and can be managed at home",
-                "es": "Tus síntomas parecen leves y pueden tratarse en casa",
-                "hi": "आपके लक्षण हल्के लगते हैं और घर पर इनका इलाज किया जा सकता है",
-                "fr": "Vos symptômes semblent légers et peuvent être gérés à domicile",
-                "pt": "Seus sintomas parecem leves e podem ser tratados em casa",
-                "ar": "تبدو أعراضك خفيفة ويمكن التعامل معها في المنزل",
-                "zh": "您的症状似乎很轻微，可以在家中处理",
-                "bn": "আপনার লক্ষণগুলি হালকা মনে হচ্ছে এবং বাড়িতেই সামলানো যেতে পারে",
-                "ru": "Ваши симптомы кажутся легкими и могут быть устранены дома",
-                "de": "Ihre Symptome scheinen mild zu sein und können zu Hause behandelt werden"
-            },
-            "urgent_care": {
-                "en": "Your symptoms require prompt medical attention within 24 hours",
-                "es": "Tus síntomas requieren atención médica inmediata en 24 horas",
-                "hi": "आपके लक्षणों को 24 घंटों के भीतर तत्काल चिकित्सा ध्यान की आवश्यकता है",
-                "fr": "Vos symptômes nécessitent une attention médicale rapide dans les 24 heures",
-                "pt": "Seus sintomas requerem atenção médica imediata em 24 horas",
-                "ar": "تتطلب أعراضك عناية طبية فورية خلال 24 ساعة",
-                "zh": "您的症状需要在24小时内得到及时的医疗关注",
-                "bn": "আপনার লক্ষণগুলির জন্য 24 ঘন্টার মধ্যে তাৎক্ষণিক চিকিৎসা মনোযোগ প্রয়োজন",
-                "ru": "Ваши симптомы требуют срочной медицинской помощи в течение 24 часов",
-                "de": "Ihre Symptome erfordern innerhalb von 24 Stunden eine rasche ärztliche Behandlung"
-            }
+    def _build_source_index(self) -> Dict[str, Tuple[Pattern, Dict[str, Dict[str, str]]]]:
+        """Compile one phrase matcher per source language for single-pass scanning"""
+        phrases_by_lang: Dict[str, Dict[str, Dict[str, str]]] = {}
+        for folded in self._translations_folded.values():
+            for lang, phrase in folded.items():
+                phrases_by_lang.setdefault(lang, {})[phrase] = folded
+        
+        index = {}
+        for lang, phrases in phrases_by_lang.items():
+            # Longer phrases first so multi-word terms win over their sub-words
+            ordered = sorted(phrases, key=len, reverse=True)
+            pattern = re.compile("|".join(map(re.escape, ordered)))
+            index[sys.intern(lang)] = (pattern, phrases)
+        return index
+    
+    def _build_response_translator(self) -> Tuple[Pattern, Dict[str, Dict[str, str]]]:
+        """Compile the English phrase matcher and per-language replacement tables"""
+        english = {
+            folded["en"]: key for key, folded in self._translations_folded.items() if "en" in folded
         }
+        # Whole words only, so "feverish" or "headaches" are never half-translated;
+        # lookarounds rather than \b because some phrases end in punctuation
+        pattern = re.compile(
+            r"(?<!\w)(?:" + "|".join(map(re.escape, sorted(english, key=len, reverse=True))) + r")(?!\w)",
+            re.IGNORECASE
+        )
+        
+        lookups: Dict[str, Dict[str, str]] = {}
+        for phrase, key in english.items():
+            for lang, text in self.translations[key].items():
+                lookups.setdefault(lang, {})[phrase] = text
+        return pattern, lookups
+    
+    def translate_response(self, text: str, to_lang: str) -> str:
+        """Replace every known English phrase in a response with its translation"""
+        lookup = self._response_lookups.get(to_lang)
+        if not lookup:
+            return text
+        return self._response_pattern.sub(
+            lambda match: lookup.get(match.group(0).casefold(), match.group(0)), text
+        )
     
     def translate_text(self, text: str, from_lang: str, to_lang: str) -> str:
         """Translate text from one language to another"""
         # Simple keyword-based translation for medical terms
-        translated_text = text.lower()
+        translated_text = text.casefold()
+        
+        entry = self._source_index.get(from_lang)
+        if entry is None:
+            return translated_text
+        pattern, phrases = entry
         
-        # Look for medical terms and translate them
-        for term, translations in self.translations.items():
-            if from_lang in translations:
-                source_text = translations[from_lang].lower()
-                if source_text in translated_text and to_lang in translations:
-                    translated_text = translated_text.replace(
-                        source_text, 
-                        translations[to_lang].lower()
-                    )
+        # Replace every known medical term in a single scan of the text
+        def replace(match):
+            targets = phrases[match.group(0)]
+            return targets.get(to_lang, match.group(0))
         
-        return translated_text
+        return pattern.sub(replace, translated_text)
     
     def get_translation(self, key: str, language: str) -> str:
         """Get a specific translation for a key and language"""
-        if key in self.translations and language in self.translations[key]:
-            return self.translations[key][language]
-        return self.translations[key].get("en", key)  # Fallback to English
+        table = self._by_lang.get(language) or self._by_lang["en"]  # Fallback to English
+        return table.get(key, key)
+    
+    def get_translations_bulk(self, keys: List[str], languages: List[str]) -> Dict[Tuple[str, str], str]:
+        """Translations for every (key, language) pair, with get_translation's fallbacks"""
+        english = self._by_lang["en"]
+        table: Dict[Tuple[str, str], str] = {}
+        for language in languages:
+            by_key = self._by_lang.get(language) or english
+            for key in keys:
+                table[key, language] = by_key.get(key, key)
+        return table
+
+# Set by VoiceAssistant.preload_shared; worker processes inherit it through the environment
+_SHM_ENV_VAR = "VA_SHM_NAME"
+
+def _open_shared_segment(shm_name: str) -> shared_memory.SharedMemory:
+    """Attach to a segment owned by another process without taking over its cleanup"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=shm_name, track=False)
+    
+    # Before 3.13 attaching always registers with the resource tracker. Forked and
+    # spawned workers share the parent's tracker, but any other process starts its
+    # own, which would unlink the segment when that process exits
+    owns_tracker = resource_tracker._resource_tracker._fd is None
+    shm = shared_memory.SharedMemory(name=shm_name)
+    if owns_tracker:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+def _attach_shared_translator(shm_name: str) -> Optional[LanguageTranslator]:
+    """Load the translator a parent process published to shared memory, if it is usable"""
+    try:
+        shm = _open_shared_segment(shm_name)
+    except FileNotFoundError:
+        logger.warning("Shared translator segment %s not found; building translator locally", shm_name)
+        return None
+    try:
+        return pickle.loads(shm.buf)
+    except Exception:
+        # A stale or truncated segment must not take every worker down with it
+        logger.warning("Shared translator segment %s is unreadable; building translator locally",
+                       shm_name, exc_info=True)
+        return None
+    finally:
+        shm.close()
+
+@functools.lru_cache(maxsize=1)
+def get_translator() -> LanguageTranslator:
+    """Shared translator instance so every VoiceAssistant reuses one phrase index"""
+    shm_name = os.environ.get(_SHM_ENV_VAR)
+    if shm_name:
+        translator = _attach_shared_translator(shm_name)
+        if translator is not None:
+            return translator
+    return LanguageTranslator()
+
+# Common speech recognition errors for medical terms
+_SPEECH_CORRECTIONS: Dict[SupportedLanguage, Dict[str, str]] = {
+    SupportedLanguage.ENGLISH: {
+        "chest pane": "chest pain",
+        "head egg": "headache", 
+        "fever": "fever",
+        "difficultly breathing": "difficulty breathing",
+        "short of breath": "shortness of breath"
+    },
+    SupportedLanguage.SPANISH: {
+        "dolor de pecho": "dolor en el pecho",
+        "dificultad para respirar": "dificultad para respirar"
+    },
+    SupportedLanguage.HINDI: {
+        "सीने में दर्द": "सीने में दर्द",
+        "सांस लेने में दिक्कत": "सांस लेने में कठिनाई"
+    }
+}
+
+# Speech phrases repeat heavily across sessions, so the pure text
+# transforms below are memoized on their (hashable) inputs.
+
+def _apply_automaton(automaton, text: str) -> str:
+    """Replace the leftmost-longest automaton matches in one pass over text"""
+    pieces = []
+    position = 0
+    for end, (length, replacement) in automaton.iter_long(text):
+        pieces.append(text[position:end - length + 1])
+        pieces.append(replacement)
+        position = end + 1
+    if not pieces:
+        return text
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+def _build_correctors() -> Dict[SupportedLanguage, Callable[[str], str]]:
+    """One single-pass corrector per language: an Aho-Corasick automaton when available, else a regex"""
+    correctors = {}
+    for lang, corrections in _SPEECH_CORRECTIONS.items():
+        # Entries that map a phrase to itself need no rewrite
+        fixes = {bad: good for bad, good in corrections.items() if bad != good}
+        if not fixes:
+            continue
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for bad, good in fixes.items():
+                automaton.add_word(bad, (len(bad), good))
+            automaton.make_automaton()
+            correctors[lang] = functools.partial(_apply_automaton, automaton)
+        else:
+            pattern = re.compile("|".join(map(re.escape, sorted(fixes, key=len, reverse=True))))
+            correctors[lang] = functools.partial(pattern.sub, lambda match, fixes=fixes: fixes[match.group(0)])
+    return correctors
+
+_CORRECTORS = _build_correctors()
+
+@functools.lru_cache(maxsize=2048)
+def _normalize_speech(speech_text: str, language: SupportedLanguage) -> str:
+    """Casefold speech input and apply known recognition corrections"""
+    normalized = speech_text.casefold().strip()
+    
+    corrector = _CORRECTORS.get(language)
+    if corrector is None:
+        return normalized
+    return corrector(normalized)
+
+@functools.lru_cache(maxsize=2048)
+def _translate_response_text(text: str, lang_code: str) -> str:
+    """Translate the known medical phrases in a response"""
+    # Unknown sentences pass through unchanged (in production, use translation API)
+    return get_translator().translate_response(text, lang_code)
+
+@functools.lru_cache(maxsize=2048)
+def _build_ssml(text: str, ssml_template: str) -> str:
+    """Render the SSML document for one utterance"""
+    # Escape user-supplied text so it cannot inject markup into the document
+    return ssml_template.format(TEXT=_xml_escape(text))
+
+# Fallback names if i18n system not available
+_LANGUAGE_DISPLAY_NAMES: Dict[SupportedLanguage, str] = {
+    # Tier 1: Major Languages
+    SupportedLanguage.ENGLISH: "English",
+    SupportedLanguage.SPANISH: "Español", 
+    SupportedLanguage.HINDI: "हिन्दी",
+    SupportedLanguage.FRENCH: "Français",
+    SupportedLanguage.PORTUGUESE: "Português",
+    SupportedLanguage.ARABIC: "العربية",
+    SupportedLanguage.CHINESE: "中文",
+    SupportedLanguage.BENGALI: "বাংলা",
+    SupportedLanguage.RUSSIAN: "Русский",
+    SupportedLanguage.GERMAN: "Deutsch",
+
+    # Tier 2: Extended Languages
+    SupportedLanguage.JAPANESE: "日本語",
+    SupportedLanguage.KOREAN: "한국어",
+    SupportedLanguage.ITALIAN: "Italiano",
+    SupportedLanguage.DUTCH: "Nederlands",
+    SupportedLanguage.TURKISH: "Türkçe",
+    SupportedLanguage.POLISH: "Polski",
+    SupportedLanguage.THAI: "ไทย",
+    SupportedLanguage.VIETNAMESE: "Tiếng Việt",
+    SupportedLanguage.SWEDISH: "Svenska",
+    SupportedLanguage.NORWEGIAN: "Norsk",
+    SupportedLanguage.DANISH: "Dansk",
+    SupportedLanguage.FINNISH: "Suomi",
+    SupportedLanguage.HEBREW: "עברית",
+
+    # Tier 3: Regional Languages
+    SupportedLanguage.INDONESIAN: "Bahasa Indonesia",
+    SupportedLanguage.MALAY: "Bahasa Melayu",
+    SupportedLanguage.FILIPINO: "Filipino",
+    SupportedLanguage.CZECH: "Čeština",
+    SupportedLanguage.HUNGARIAN: "Magyar",
+    SupportedLanguage.ROMANIAN: "Română",
+    SupportedLanguage.BULGARIAN: "Български",
+    SupportedLanguage.CROATIAN: "Hrvatski",
+    SupportedLanguage.SLOVAK: "Slovenčina",
+    SupportedLanguage.SLOVENIAN: "Slovenščina",
+    SupportedLanguage.UKRAINIAN: "Українська",
+
+    # South Asian Languages
+    SupportedLanguage.TAMIL: "தமிழ்",
+    SupportedLanguage.TELUGU: "తెలుగు",
+    SupportedLanguage.GUJARATI: "ગુજરાતી",
+    SupportedLanguage.PUNJABI: "ਪੰਜਾਬੀ",
+    SupportedLanguage.MARATHI: "मराठी",
+    SupportedLanguage.KANNADA: "ಕನ್ನಡ",
+    SupportedLanguage.MALAYALAM: "മലയാളം",
+    SupportedLanguage.URDU: "اردو",
+    SupportedLanguage.NEPALI: "नेपाली",
+    SupportedLanguage.SINHALA: "සිංහල",
+
+    # Middle Eastern & Central Asian
+    SupportedLanguage.PERSIAN: "فارسی",
+    SupportedLanguage.KURDISH: "Kurdî",
+    SupportedLanguage.AZERBAIJANI: "Azərbaycanca",
+    SupportedLanguage.ARMENIAN: "Հայերեն",
+    SupportedLanguage.GEORGIAN: "ქართული",
+    SupportedLanguage.KAZAKH: "Қазақша",
+    SupportedLanguage.UZBEK: "Oʻzbekcha",
+
+    # African Languages
+    SupportedLanguage.SWAHILI: "Kiswahili",
+    SupportedLanguage.AMHARIC: "አማርኛ",
+    SupportedLanguage.YORUBA: "Yorùbá",
+    SupportedLanguage.IGBO: "Igbo",
+    SupportedLanguage.HAUSA: "Hausa",
+
+    # Additional European
+    SupportedLanguage.CATALAN: "Català",
+    SupportedLanguage.BASQUE: "Euskera",
+    SupportedLanguage.GALICIAN: "Galego",
+    SupportedLanguage.WELSH: "Cymraeg",
+    SupportedLanguage.IRISH: "Gaeilge",
+    SupportedLanguage.ICELANDIC: "Íslenska",
+    SupportedLanguage.ESTONIAN: "Eesti",
+    SupportedLanguage.LATVIAN: "Latviešu",
+    SupportedLanguage.LITHUANIAN: "Lietuvių",
+}
+
+def _language_name(language: SupportedLanguage) -> str:
+    """Human-readable language name in native script"""
+    # Use the i18n system's naming when available for consistency
+    if WorldLanguages is not None:
+        lang_info = WorldLanguages.get_language(language.code)
+        if lang_info:
+            return lang_info.native_name
+    return _LANGUAGE_DISPLAY_NAMES.get(language, language.code)
+
+# Shared by every assistant, so the entries are read-only views
+_SUPPORTED_LANGUAGES: Tuple[Mapping[str, str], ...] = tuple(
+    MappingProxyType({"code": lang.code, "name": _language_name(lang)}) for lang in SupportedLanguage
+)
+
+@functools.lru_cache(maxsize=1)
+def _emergency_messages() -> Tuple[str, ...]:
+    """Emergency message per language, indexed by SupportedLanguage"""
+    translator = get_translator()
+    return tuple(translator.get_translation("emergency", lang.code) for lang in SupportedLanguage)
 
 class VoiceAssistant:
     """Main voice assistant class handling speech recognition and synthesis"""
     
+    # Language indicators based on common medical terms and greetings
+    LANGUAGE_INDICATORS = {
+        SupportedLanguage.SPANISH: [
+            "dolor", "fiebre", "cabeza", "respirar", "pecho", "hola", "síntomas"
+        ],
+        SupportedLanguage.HINDI: [
+            "दर्द", "बुखार", "सिर", "सांस", "सीने", "नमस्ते", "लक्षण"
+        ],
+        SupportedLanguage.FRENCH: [
+            "douleur", "fièvre", "tête", "respirer", "thoracique", "bonjour", "symptômes"
+        ],
+        SupportedLanguage.PORTUGUESE: [
+            "dor", "febre", "cabeça", "respirar", "peito", "olá", "sintomas"
+        ],
+        SupportedLanguage.ARABIC: [
+            "ألم", "حمى", "رأس", "تنفس", "صدر", "مرحبا", "أعراض"
+        ],
+        SupportedLanguage.CHINESE: [
+            "疼痛", "发烧", "头", "呼吸", "胸", "你好", "症状"
+        ],
+        SupportedLanguage.BENGALI: [
+            "ব্যথা", "জ্বর", "মাথা", "শ্বাস", "বুক", "হ্যালো", "লক্ষণ"
+        ],
+        SupportedLanguage.RUSSIAN: [
+            "боль", "лихорадка", "голова", "дышать", "грудь", "привет", "симптомы"
+        ],
+        SupportedLanguage.GERMAN: [
+            "schmerz", "fieber", "kopf", "atmen", "brust", "hallo", "symptome"
+        ]
+    }
+    
+    _INDICATOR_SETS = {
+        lang: frozenset(indicators) for lang, indicators in LANGUAGE_INDICATORS.items()
+    }
+    _INDICATOR_PATTERNS = {
+        lang: re.compile("|".join(map(re.escape, sorted(indicators, key=len, reverse=True))))
+        for lang, indicators in LANGUAGE_INDICATORS.items()
+    }
+    
     def __init__(self):
-        self.translator = LanguageTranslator()
+        self.translator = get_translator()
         self.current_language = SupportedLanguage.ENGLISH
-        self.voice_configs = self._get_voice_configs()
-        
-    def _get_voice_configs(self) -> Dict[SupportedLanguage, VoiceConfig]:
-        """Configure voice settings for each supported language"""
-        return {
-            # Tier 1: Major World Languages (Premium voice quality)
-            SupportedLanguage.ENGLISH: VoiceConfig(
-                SupportedLanguage.ENGLISH, "en-US", speech_rate=0.9
-            ),
-            SupportedLanguage.SPANISH: VoiceConfig(
-                SupportedLanguage.SPANISH, "es-ES", speech_rate=0.9
-            ),
-            SupportedLanguage.HINDI: VoiceConfig(
-                SupportedLanguage.HINDI, "hi-IN", speech_rate=0.8
-            ),
-            SupportedLanguage.FRENCH: VoiceConfig(
-                SupportedLanguage.FRENCH, "fr-FR", speech_rate=0.9
-            ),
-            SupportedLanguage.PORTUGUESE: VoiceConfig(
-                SupportedLanguage.PORTUGUESE, "pt-BR", speech_rate=0.9
-            ),
-            SupportedLanguage.ARABIC: VoiceConfig(
-                SupportedLanguage.ARABIC, "ar-SA", speech_rate=0.8
-            ),
-            SupportedLanguage.CHINESE: VoiceConfig(
-                SupportedLanguage.CHINESE, "zh-CN", speech_rate=0.8
-            ),
-            SupportedLanguage.BENGALI: VoiceConfig(
-                SupportedLanguage.BENGALI, "bn-IN", speech_rate=0.8
-            ),
-            SupportedLanguage.RUSSIAN: VoiceConfig(
-                SupportedLanguage.RUSSIAN, "ru-RU", speech_rate=0.9
-            ),
-            SupportedLanguage.GERMAN: VoiceConfig(
-                SupportedLanguage.GERMAN, "de-DE", speech_rate=0.9
-            ),
-            
-            # Tier 2: Extended Language Support
-            SupportedLanguage.JAPANESE: VoiceConfig(
-                SupportedLanguage.JAPANESE, "ja-JP", speech_rate=0.8
-            ),
-            SupportedLanguage.KOREAN: VoiceConfig(
-                SupportedLanguage.KOREAN, "ko-KR", speech_rate=0.8
-            ),
-            SupportedLanguage.ITALIAN: VoiceConfig(
-                SupportedLanguage.ITALIAN, "it-IT", speech_rate=0.9
-            ),
-            SupportedLanguage.DUTCH: VoiceConfig(
-                SupportedLanguage.DUTCH, "nl-NL", speech_rate=0.9
-            ),
-            SupportedLanguage.TURKISH: VoiceConfig(
-                SupportedLanguage.TURKISH, "tr-TR", speech_rate=0.9
-            ),
-            SupportedLanguage.POLISH: VoiceConfig(
-                SupportedLanguage.POLISH, "pl-PL", speech_rate=0.9
-            ),
-            SupportedLanguage.THAI: VoiceConfig(
-                SupportedLanguage.THAI, "th-TH", speech_rate=0.8
-            ),
-            SupportedLanguage.VIETNAMESE: VoiceConfig(
-                SupportedLanguage.VIETNAMESE, "vi-VN", speech_rate=0.8
-            ),
-            SupportedLanguage.SWEDISH: VoiceConfig(
-                SupportedLanguage.SWEDISH, "sv-SE", speech_rate=0.9
-            ),
-            SupportedLanguage.NORWEGIAN: VoiceConfig(
-                SupportedLanguage.NORWEGIAN, "no-NO", speech_rate=0.9
-            ),
-            SupportedLanguage.DANISH: VoiceConfig(
-                SupportedLanguage.DANISH, "da-DK", speech_rate=0.9
-            ),
-            SupportedLanguage.FINNISH: VoiceConfig(
-                SupportedLanguage.FINNISH, "fi-FI", speech_rate=0.9
-            ),
-            SupportedLanguage.HEBREW: VoiceConfig(
-                SupportedLanguage.HEBREW, "he-IL", speech_rate=0.8
-            ),
-            
-            # Tier 3: Regional Languages (Basic voice support)
-            SupportedLanguage.INDONESIAN: VoiceConfig(
-                SupportedLanguage.INDONESIAN, "id-ID", speech_rate=0.9
-            ),
-            SupportedLanguage.MALAY: VoiceConfig(
-                SupportedLanguage.MALAY, "ms-MY", speech_rate=0.9
-            ),
-            SupportedLanguage.FILIPINO: VoiceConfig(
-                SupportedLanguage.FILIPINO, "tl-PH", speech_rate=0.9
-            ),
-            SupportedLanguage.CZECH: VoiceConfig(
-                SupportedLanguage.CZECH, "cs-CZ", speech_rate=0.9
-            ),
-            SupportedLanguage.HUNGARIAN: VoiceConfig(
-                SupportedLanguage.HUNGARIAN, "hu-HU", speech_rate=0.9
-            ),
-            SupportedLanguage.ROMANIAN: VoiceConfig(
-                SupportedLanguage.ROMANIAN, "ro-RO", speech_rate=0.9
-            ),
-            SupportedLanguage.BULGARIAN: VoiceConfig(
-                SupportedLanguage.BULGARIAN, "bg-BG", speech_rate=0.9
-            ),
-            SupportedLanguage.CROATIAN: VoiceConfig(
-                SupportedLanguage.CROATIAN, "hr-HR", speech_rate=0.9
-            ),
-            SupportedLanguage.SLOVAK: VoiceConfig(
-                SupportedLanguage.SLOVAK, "sk-SK", speech_rate=0.9
-            ),
-            SupportedLanguage.SLOVENIAN: VoiceConfig(
-                SupportedLanguage.SLOVENIAN, "sl-SI", speech_rate=0.9
-            ),
-            SupportedLanguage.UKRAINIAN: VoiceConfig(
-                SupportedLanguage.UKRAINIAN, "uk-UA", speech_rate=0.9
-            ),
-            
-            # South Asian Languages
-            SupportedLanguage.TAMIL: VoiceConfig(
-                SupportedLanguage.TAMIL, "ta-IN", speech_rate=0.8
-            ),
-            SupportedLanguage.TELUGU: VoiceConfig(
-                SupportedLanguage.TELUGU, "te-IN", speech_rate=0.8
-            ),
-            SupportedLanguage.GUJARATI: VoiceConfig(
-                SupportedLanguage.GUJARATI, "gu-IN", speech_rate=0.8
-            ),
-            SupportedLanguage.PUNJABI: VoiceConfig(
-                SupportedLanguage.PUNJABI, "pa-IN", speech_rate=0.8
-            ),
-            SupportedLanguage.MARATHI: VoiceConfig(
-                SupportedLanguage.MARATHI, "mr-IN", speech_rate=0.8
-            ),
-            SupportedLanguage.KANNADA: VoiceConfig(
-                SupportedLanguage.KANNADA, "kn-IN", speech_rate=0.8
-            ),
-            SupportedLanguage.MALAYALAM: VoiceConfig(
-                SupportedLanguage.MALAYALAM, "ml-IN", speech_rate=0.8
-            ),
-            SupportedLanguage.URDU: VoiceConfig(
-                SupportedLanguage.URDU, "ur-PK", speech_rate=0.8
-            ),
-            SupportedLanguage.NEPALI: VoiceConfig(
-                SupportedLanguage.NEPALI, "ne-NP", speech_rate=0.8
-            ),
-            SupportedLanguage.SINHALA: VoiceConfig(
-                SupportedLanguage.SINHALA, "si-LK", speech_rate=0.8
-            ),
-            
-            # Middle Eastern & Central Asian Languages
-            SupportedLanguage.PERSIAN: VoiceConfig(
-                SupportedLanguage.PERSIAN, "fa-IR", speech_rate=0.8
-            ),
-            SupportedLanguage.KURDISH: VoiceConfig(
-                SupportedLanguage.KURDISH, "ku-IQ", speech_rate=0.8
-            ),
-            SupportedLanguage.AZERBAIJANI: VoiceConfig(
-                SupportedLanguage.AZERBAIJANI, "az-AZ", speech_rate=0.9
-            ),
-            SupportedLanguage.ARMENIAN: VoiceConfig(
-                SupportedLanguage.ARMENIAN, "hy-AM", speech_rate=0.9
-            ),
-            SupportedLanguage.GEORGIAN: VoiceConfig(
-                SupportedLanguage.GEORGIAN, "ka-GE", speech_rate=0.9
-            ),
-            SupportedLanguage.KAZAKH: VoiceConfig(
-                SupportedLanguage.KAZAKH, "kk-KZ", speech_rate=0.9
-            ),
-            SupportedLanguage.UZBEK: VoiceConfig(
-                SupportedLanguage.UZBEK, "uz-UZ", speech_rate=0.9
-            ),
-            
-            # African Languages (using available regional codes)
-            SupportedLanguage.SWAHILI: VoiceConfig(
-                SupportedLanguage.SWAHILI, "sw-KE", speech_rate=0.9
-            ),
-            SupportedLanguage.AMHARIC: VoiceConfig(
-                SupportedLanguage.AMHARIC, "am-ET", speech_rate=0.8
-            ),
-            SupportedLanguage.YORUBA: VoiceConfig(
-                SupportedLanguage.YORUBA, "yo-NG", speech_rate=0.9
-            ),
-            SupportedLanguage.IGBO: VoiceConfig(
-                SupportedLanguage.IGBO, "ig-NG", speech_rate=0.9
-            ),
-            SupportedLanguage.HAUSA: VoiceConfig(
-                SupportedLanguage.HAUSA, "ha-NG", speech_rate=0.9
-            ),
-            
-            # Additional European Languages
-            SupportedLanguage.CATALAN: VoiceConfig(
-                SupportedLanguage.CATALAN, "ca-ES", speech_rate=0.9
-            ),
-            SupportedLanguage.BASQUE: VoiceConfig(
-                SupportedLanguage.BASQUE, "eu-ES", speech_rate=0.9
-            ),
-            SupportedLanguage.GALICIAN: VoiceConfig(
-                SupportedLanguage.GALICIAN, "gl-ES", speech_rate=0.9
-            ),
-            SupportedLanguage.WELSH: VoiceConfig(
-                SupportedLanguage.WELSH, "cy-GB", speech_rate=0.9
-            ),
-            SupportedLanguage.IRISH: VoiceConfig(
-                SupportedLanguage.IRISH, "ga-IE", speech_rate=0.9
-            ),
-            SupportedLanguage.ICELANDIC: VoiceConfig(
-                SupportedLanguage.ICELANDIC, "is-IS", speech_rate=0.9
-            ),
-            SupportedLanguage.ESTONIAN: VoiceConfig(
-                SupportedLanguage.ESTONIAN, "et-EE", speech_rate=0.9
-            ),
-            SupportedLanguage.LATVIAN: VoiceConfig(
-                SupportedLanguage.LATVIAN, "lv-LV", speech_rate=0.9
-            ),
-            SupportedLanguage.LITHUANIAN: VoiceConfig(
-                SupportedLanguage.LITHUANIAN, "lt-LT", speech_rate=0.9
-            ),
-        }
+        self.voice_configs = _VOICE_CONFIGS
     
+    @classmethod
+    def preload_shared(cls) -> shared_memory.SharedMemory:
+        """Publish the translation tables for worker processes started after this call
+        
+        Workers find the segment through VA_SHM_NAME and unpickle the prebuilt
+        translator instead of parsing and indexing the tables themselves. The
+        caller owns the segment and should close() and unlink() it on shutdown.
+        """
+        payload = pickle.dumps(get_translator(), protocol=pickle.HIGHEST_PROTOCOL)
+        shm = shared_memory.SharedMemory(create=True, size=len(payload))
+        shm.buf[:len(payload)] = payload
+        os.environ[_SHM_ENV_VAR] = shm.name
+        return shm
+        
     def detect_language(self, text: str) -> SupportedLanguage:
         """Simple language detection based on common words and patterns"""
+        # Non-Latin scripts identify the language without any vocabulary lookup
+        script_language = _detect_script(text)
+        if script_language is not None:
+            return script_language
+        
         text_lower = text.lower()
         
-        # Language indicators based on common medical terms and greetings
-        language_indicators = {
-            SupportedLanguage.SPANISH: [
-                "dolor", "fiebre", "cabeza", "respirar", "pecho", "hola", "síntomas"
-            ],
-            SupportedLanguage.HINDI: [
-                "दर्द", "बुखार", "सिर", "सांस", "सीने", "नमस्ते", "लक्षण"
-            ],
-            SupportedLanguage.FRENCH: [
-                "douleur", "fièvre", "tête", "respirer", "thoracique", "bonjour", "symptômes"
-            ],
-            SupportedLanguage.PORTUGUESE: [
-                "dor", "febre", "cabeça", "respirar", "peito", "olá", "sintomas"
-            ],
-            SupportedLanguage.ARABIC: [
-                "ألم", "حمى", "رأس", "تنفس", "صدر", "مرحبا", "أعراض"
-            ],
-            SupportedLanguage.CHINESE: [
-                "疼痛", "发烧", "头", "呼吸", "胸", "你好", "症状"
-            ],
-            SupportedLanguage.BENGALI: [
-                "ব্যথা", "জ্বর", "মাথা", "শ্বাস", "বুক", "হ্যালো", "লক্ষণ"
-            ],
-            SupportedLanguage.RUSSIAN: [
-                "боль", "лихорадка", "голова", "дышать", "грудь", "привет", "симптомы"
-            ],
-            SupportedLanguage.GERMAN: [
-                "schmerz", "fieber", "kopf", "atmen", "brust", "hallo", "symptome"
-            ]
-        }
+        # Whole-word matches first: one set intersection per language
+        tokens = set(_WORD_PATTERN.findall(text_lower))
+        language_scores = _score_languages(tokens, self._INDICATOR_SETS)
         
-        # Count matches for each language
-        language_scores = {}
-        for lang, indicators in language_indicators.items():
-            score = sum(1 for indicator in indicators if indicator in text_lower)
-            if score > 0:
-                language_scores[lang] = score
+        # Inflected forms and scripts without clean word boundaries
+        # (e.g. Devanagari vowel signs) only match as substrings
+        if not language_scores:
+            # Script languages returned above, so only Latin-script indicators can
+            # still match, and any hit lies inside one token: scanning the distinct
+            # tokens once keeps long, repetitive input from being rescanned in full
+            language_scores = _score_patterns(" ".join(tokens), self._INDICATOR_PATTERNS)
         
         # Return language with highest score, default to English
         if language_scores:
@@ -515,34 +946,9 @@ class VoiceAssistant:
     
     def normalize_speech_input(self, speech_text: str, language: SupportedLanguage) -> str:
         """Normalize speech input to handle pronunciation variations"""
-        normalized = speech_text.lower().strip()
-        
-        # Handle common speech recognition errors for medical terms
-        corrections = {
-            SupportedLanguage.ENGLISH: {
-                "chest pane": "chest pain",
-                "head egg": "headache", 
-                "fever": "fever",
-                "difficultly breathing": "difficulty breathing",
-                "short of breath": "shortness of breath"
-            },
-            SupportedLanguage.SPANISH: {
-                "dolor de pecho": "dolor en el pecho",
-                "dificultad para respirar": "dificultad para respirar"
-            },
-            SupportedLanguage.HINDI: {
-                "सीने में दर्द": "सीने में दर्द",
-                "सांस लेने में दिक्कत": "सांस लेने में कठिनाई"
-            }
-        }
-        
-        if language in corrections:
-            for error, correction in corrections[language].items():
-                normalized = normalized.replace(error, correction)
-        
-        return normalized
+        return _normalize_speech(speech_text, language)
     
-    def process_voice_input(self, speech_text: str, detected_language: Optional[SupportedLanguage] = None) -> Dict:
+    def process_voice_input(self, speech_text: str, detected_language: Optional[SupportedLanguage] = None) -> VoiceResult:
         """Process voice input and return structured data for triage"""
         
         # Detect language if not provided
@@ -557,26 +963,52 @@ class VoiceAssistant:
         if detected_language != SupportedLanguage.ENGLISH:
             english_text = self.translator.translate_text(
                 normalized_text, 
-                detected_language.value, 
-                SupportedLanguage.ENGLISH.value
+                detected_language.code, 
+                SupportedLanguage.ENGLISH.code
             )
         
-        return {
-            "original_text": speech_text,
-            "normalized_text": normalized_text,
-            "english_text": english_text,
-            "detected_language": detected_language.value,
-            "language_confidence": 0.8  # Simple confidence score
-        }
+        return VoiceResult(speech_text, normalized_text, english_text, detected_language.code)
+    
+    def process_voice_input_batch(self, speech_texts: List[str],
+                                  detected_languages: Optional[List[Optional[SupportedLanguage]]] = None) -> List[VoiceResult]:
+        """Process several voice inputs at once, returning results in input order"""
+        if detected_languages is None:
+            detected_languages = [None] * len(speech_texts)
+        elif len(detected_languages) != len(speech_texts):
+            raise ValueError(
+                f"Got {len(detected_languages)} languages for {len(speech_texts)} speech inputs"
+            )
+        
+        # Group inputs by language so per-language work is done once per group
+        groups: Dict[SupportedLanguage, List[int]] = {}
+        for index, (speech_text, language) in enumerate(zip(speech_texts, detected_languages)):
+            if language is None:
+                language = self.detect_language(speech_text)
+            groups.setdefault(language, []).append(index)
+        
+        results: List[Optional[VoiceResult]] = [None] * len(speech_texts)
+        english_code = SupportedLanguage.ENGLISH.code
+        for language, indices in groups.items():
+            needs_translation = language != SupportedLanguage.ENGLISH
+            for index in indices:
+                speech_text = speech_texts[index]
+                normalized_text = self.normalize_speech_input(speech_text, language)
+                english_text = normalized_text
+                if needs_translation:
+                    english_text = self.translator.translate_text(normalized_text, language.code, english_code)
+                
+                results[index] = VoiceResult(speech_text, normalized_text, english_text, language.code)
+        
+        return results
     
     def generate_voice_response(self, response_text: str, target_language: SupportedLanguage) -> Dict:
         """Generate voice response data for text-to-speech"""
         
-        # Get appropriate voice configuration
-        voice_config = self.voice_configs.get(target_language, self.voice_configs[SupportedLanguage.ENGLISH])
+        voice_config = self.voice_configs[target_language]
         
-        # Translate response if needed
-        if target_language != SupportedLanguage.ENGLISH:
+        # Translate response if needed; text with no letter that could match an
+        # English phrase (e.g. already in the target script) is used as is
+        if target_language != SupportedLanguage.ENGLISH and _ENGLISH_LETTER.search(response_text):
             # For known phrases, use direct translations
             translated_text = self._translate_response(response_text, target_language)
         else:
@@ -584,158 +1016,134 @@ class VoiceAssistant:
         
         return {
             "text": translated_text,
-            "language": target_language.value,
-            "voice_name": voice_config.voice_name,
-            "speech_rate": voice_config.speech_rate,
-            "speech_pitch": voice_config.speech_pitch,
+            **_VOICE_SETTINGS[target_language],
             "ssml": self._generate_ssml(translated_text, voice_config)
         }
     
+    async def generate_voice_response_stream(self, response_text: str,
+                                             target_language: SupportedLanguage) -> AsyncIterator[Dict]:
+        """Yield voice response data sentence by sentence for streaming playback"""
+        chunks = [chunk for chunk in _SENTENCE_BOUNDARY.split(response_text.strip()) if chunk]
+        if not chunks:
+            return
+        
+        # Keep one chunk in flight so the next sentence is ready when playback of the current ends
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            ahead = pool.submit(self.generate_voice_response, chunks[0], target_language)
+            for next_chunk in chunks[1:]:
+                speech_data = await asyncio.wrap_future(ahead)
+                ahead = pool.submit(self.generate_voice_response, next_chunk, target_language)
+                yield speech_data
+            yield await asyncio.wrap_future(ahead)
+    
     def _translate_response(self, text: str, target_language: SupportedLanguage) -> str:
         """Translate response text to target language"""
-        text_lower = text.lower()
-        
-        # Check for known phrases and translate them
-        for key, translations in self.translator.translations.items():
-            if "en" in translations and translations["en"].lower() in text_lower:
-                if target_language.value in translations:
-                    return translations[target_language.value]
-        
-        # For complex sentences, return original (in production, use translation API)
-        return text
+        return _translate_response_text(text, target_language.code)
     
     def _generate_ssml(self, text: str, voice_config: VoiceConfig) -> str:
         """Generate SSML (Speech Synthesis Markup Language) for better voice output"""
-        return f"""
-        <speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{voice_config.voice_name}">
-            <prosody rate="{voice_config.speech_rate}" pitch="{voice_config.speech_pitch}">
-                {text}
-            </prosody>
-        </speak>
-        """
+        return _build_ssml(text, voice_config.ssml_template)
     
     def get_emergency_message(self, language: SupportedLanguage) -> str:
         """Get emergency message in specified language"""
-        return self.translator.get_translation("emergency", language.value)
+        return _emergency_messages()[language]
+    
+    @functools.cached_property
+    def supported_languages(self) -> Tuple[Mapping[str, str], ...]:
+        """Supported languages for the UI as read-only entries shared by every assistant"""
+        return _SUPPORTED_LANGUAGES
     
     def get_supported_languages(self) -> List[Dict]:
         """Get list of supported languages for UI"""
-        return [
-            {"code": lang.value, "name": self._get_language_name(lang)} 
-            for lang in SupportedLanguage
-        ]
+        # Fresh list and entries so callers can sort or edit them without affecting others
+        return [dict(language) for language in self.supported_languages]
     
     def _get_language_name(self, language: SupportedLanguage) -> str:
         """Get human-readable language name in native script"""
-        # Import from i18n system to get consistent naming
-        try:
-            from .i18n_system import WorldLanguages
-            lang_info = WorldLanguages.get_language(language.value)
-            if lang_info:
-                return lang_info.native_name
-        except ImportError:
-            pass
+        return _language_name(language)
+    
+class SynthesisCache:
+    """LRU cache for voice API results, optionally shared across processes via Redis"""
+    
+    REDIS_PREFIX = "voice:v1:"
+    
+    def __init__(self, max_entries: int = 512, redis_client=None, ttl_seconds: int = 86400 * 14):
+        self.max_entries = max_entries
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(namespace: str, text: str, language_code: str) -> str:
+        """Hash a request into a fixed-size cache key"""
+        return hashlib.md5(f"{namespace}|{text}|{language_code}".encode(), usedforsecurity=False).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a cached result, checking memory first and then Redis"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                return result
         
-        # Fallback names if i18n system not available
-        names = {
-            # Tier 1: Major Languages
-            SupportedLanguage.ENGLISH: "English",
-            SupportedLanguage.SPANISH: "Español", 
-            SupportedLanguage.HINDI: "हिन्दी",
-            SupportedLanguage.FRENCH: "Français",
-            SupportedLanguage.PORTUGUESE: "Português",
-            SupportedLanguage.ARABIC: "العربية",
-            SupportedLanguage.CHINESE: "中文",
-            SupportedLanguage.BENGALI: "বাংলা",
-            SupportedLanguage.RUSSIAN: "Русский",
-            SupportedLanguage.GERMAN: "Deutsch",
-            
-            # Tier 2: Extended Languages
-            SupportedLanguage.JAPANESE: "日本語",
-            SupportedLanguage.KOREAN: "한국어",
-            SupportedLanguage.ITALIAN: "Italiano",
-            SupportedLanguage.DUTCH: "Nederlands",
-            SupportedLanguage.TURKISH: "Türkçe",
-            SupportedLanguage.POLISH: "Polski",
-            SupportedLanguage.THAI: "ไทย",
-            SupportedLanguage.VIETNAMESE: "Tiếng Việt",
-            SupportedLanguage.SWEDISH: "Svenska",
-            SupportedLanguage.NORWEGIAN: "Norsk",
-            SupportedLanguage.DANISH: "Dansk",
-            SupportedLanguage.FINNISH: "Suomi",
-            SupportedLanguage.HEBREW: "עברית",
-            
-            # Tier 3: Regional Languages
-            SupportedLanguage.INDONESIAN: "Bahasa Indonesia",
-            SupportedLanguage.MALAY: "Bahasa Melayu",
-            SupportedLanguage.FILIPINO: "Filipino",
-            SupportedLanguage.CZECH: "Čeština",
-            SupportedLanguage.HUNGARIAN: "Magyar",
-            SupportedLanguage.ROMANIAN: "Română",
-            SupportedLanguage.BULGARIAN: "Български",
-            SupportedLanguage.CROATIAN: "Hrvatski",
-            SupportedLanguage.SLOVAK: "Slovenčina",
-            SupportedLanguage.SLOVENIAN: "Slovenščina",
-            SupportedLanguage.UKRAINIAN: "Українська",
-            
-            # South Asian Languages
-            SupportedLanguage.TAMIL: "தமிழ்",
-            SupportedLanguage.TELUGU: "తెలుగు",
-            SupportedLanguage.GUJARATI: "ગુજરાતી",
-            SupportedLanguage.PUNJABI: "ਪੰਜਾਬੀ",
-            SupportedLanguage.MARATHI: "मराठी",
-            SupportedLanguage.KANNADA: "ಕನ್ನಡ",
-            SupportedLanguage.MALAYALAM: "മലയാളം",
-            SupportedLanguage.URDU: "اردو",
-            SupportedLanguage.NEPALI: "नेपाली",
-            SupportedLanguage.SINHALA: "සිංහල",
-            
-            # Middle Eastern & Central Asian
-            SupportedLanguage.PERSIAN: "فارسی",
-            SupportedLanguage.KURDISH: "Kurdî",
-            SupportedLanguage.AZERBAIJANI: "Azərbaycanca",
-            SupportedLanguage.ARMENIAN: "Հայերեն",
-            SupportedLanguage.GEORGIAN: "ქართული",
-            SupportedLanguage.KAZAKH: "Қазақша",
-            SupportedLanguage.UZBEK: "Oʻzbekcha",
-            
-            # African Languages
-            SupportedLanguage.SWAHILI: "Kiswahili",
-            SupportedLanguage.AMHARIC: "አማርኛ",
-            SupportedLanguage.YORUBA: "Yorùbá",
-            SupportedLanguage.IGBO: "Igbo",
-            SupportedLanguage.HAUSA: "Hausa",
-            
-            # Additional European
-            SupportedLanguage.CATALAN: "Català",
-            SupportedLanguage.BASQUE: "Euskera",
-            SupportedLanguage.GALICIAN: "Galego",
-            SupportedLanguage.WELSH: "Cymraeg",
-            SupportedLanguage.IRISH: "Gaeilge",
-            SupportedLanguage.ICELANDIC: "Íslenska",
-            SupportedLanguage.ESTONIAN: "Eesti",
-            SupportedLanguage.LATVIAN: "Latviešu",
-            SupportedLanguage.LITHUANIAN: "Lietuvių",
-        }
-        return names.get(language, language.value)
+        if self.redis_client is not None:
+            try:
+                cached = self.redis_client.get(self.REDIS_PREFIX + key)
+            except RedisError:
+                # Redis unavailable; behave as a local miss
+                logger.warning("Synthesis cache read from Redis failed", exc_info=True)
+                cached = None
+            if cached is not None:
+                result = _json_loads(cached)
+                self._remember(key, result)
+                return result
+        return None
+    
+    def set(self, key: str, result: Dict):
+        """Store a result in memory and, when configured, in Redis"""
+        self._remember(key, result)
+        if self.redis_client is not None:
+            try:
+                self.redis_client.set(self.REDIS_PREFIX + key, json.dumps(result), ex=self.ttl_seconds)
+            except RedisError:
+                # The in-memory copy still serves this process
+                logger.warning("Synthesis cache write to Redis failed", exc_info=True)
+    
+    def _remember(self, key: str, result: Dict):
+        """Insert into the in-memory LRU, evicting the oldest entries past max_entries"""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+def _connect_redis():
+    """Return a Redis client when REDIS_URL is set and redis-py is installed"""
+    redis_url = os.environ.get('REDIS_URL')
+    if not redis_url or redis is None:
+        return None
+    return redis.Redis.from_url(redis_url)
 
 # Flask routes for voice assistant API
 def setup_voice_routes(app):
     """Setup Flask routes for voice assistant functionality"""
     
+    from flask import Response
+    
     voice_assistant = VoiceAssistant()
+    synthesis_cache = SynthesisCache(redis_client=_connect_redis())
+    
+    # The language list never changes, so serialize it once
+    languages_body = json.dumps({
+        'success': True,
+        'languages': voice_assistant.get_supported_languages()
+    })
     
     @app.route('/api/voice/languages', methods=['GET'])
     def get_supported_languages():
         """Get list of supported languages"""
-        try:
-            languages = voice_assistant.get_supported_languages()
-            return {
-                'success': True,
-                'languages': languages
-            }
-        except Exception as e:
-            return {'success': False, 'error': str(e)}, 500
+        return Response(languages_body, mimetype='application/json')
     
     @app.route('/api/voice/process', methods=['POST'])
     def process_voice_input():
@@ -749,12 +1157,15 @@ def setup_voice_routes(app):
             
             detected_language = None
             if language_code:
-                try:
-                    detected_language = SupportedLanguage(language_code)
-                except ValueError:
-                    pass
+                detected_language = _LANGUAGES_BY_CODE.get(language_code)
             
-            result = voice_assistant.process_voice_input(speech_text, detected_language)
+            cache_key = SynthesisCache.make_key(
+                'process', speech_text, detected_language.code if detected_language is not None else 'auto'
+            )
+            result = synthesis_cache.get(cache_key)
+            if result is None:
+                result = asdict(voice_assistant.process_voice_input(speech_text, detected_language))
+                synthesis_cache.set(cache_key, result)
             
             return {
                 'success': True,
@@ -774,12 +1185,13 @@ def setup_voice_routes(app):
             text = data.get('text', '')
             language_code = data.get('language_code', 'en')
             
-            try:
-                target_language = SupportedLanguage(language_code)
-            except ValueError:
-                target_language = SupportedLanguage.ENGLISH
+            target_language = _LANGUAGES_BY_CODE.get(language_code, SupportedLanguage.ENGLISH)
             
-            result = voice_assistant.generate_voice_response(text, target_language)
+            cache_key = SynthesisCache.make_key('synthesize', text, target_language.code)
+            result = synthesis_cache.get(cache_key)
+            if result is None:
+                result = voice_assistant.generate_voice_response(text, target_language)
+                synthesis_cache.set(cache_key, result)
             
             return {
                 'success': True,
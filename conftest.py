@@ -0,0 +1,9 @@
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    @pytest.fixture
+    def benchmark():
+        """Skip benchmark cases when the pytest-benchmark plugin is not installed"""
+        pytest.skip("pytest-benchmark is not installed")
@@ -4,15 +4,132 @@ Voice Assistant Demo - Multilingual Healthcare Triage
 Demonstrates the voice assistant helping illiterate users in multiple languages
 """
 
+import argparse
+import asyncio
+import functools
+import re
 import sys
 import os
+from typing import NamedTuple
 sys.path.append(os.path.dirname(__file__))
 
 from app.voice_assistant import VoiceAssistant, SupportedLanguage
 from app.triage_engine import TriageEngine
 from app.chatbot import HealthcareChatbot
 
-def demo_voice_assistant():
+MAX_CONCURRENT_SCENARIOS = 3
+
+class Scenario(NamedTuple):
+    user_type: str
+    language: SupportedLanguage
+    voice_input: str
+    scenario: str
+
+# Demo chat user id per language
+_USER_IDS = {lang: f"voice_user_{lang.code}" for lang in SupportedLanguage}
+
+# Marks the bot message that carries the triage outcome
+_TRIAGE_TAGS = re.compile(r'emergency|self-care|outpatient|urgent', re.IGNORECASE)
+
+# Static report sections, each written to stdout in a single call
+_DEMO_SUMMARY_TEXT = """
+🎉 VOICE ASSISTANT DEMO COMPLETED
+
+📊 Key Accessibility Features Demonstrated:
+✅ Speech-to-text in multiple languages
+✅ Automatic language detection
+✅ Voice recognition error correction
+✅ Text-to-speech responses
+✅ Emergency alerts with audio
+✅ Support for 10 major world languages
+✅ Offline emergency phrase capability"""
+
+_TECH_SPEC_TEXT = """
+📋 TECHNICAL SPECIFICATIONS
+==================================================
+
+🎤 Speech Recognition:
+   • Web Speech API (Chrome, Firefox, Safari)
+   • Real-time speech-to-text conversion
+   • Noise filtering and error correction
+   • Continuous and interim result processing
+
+🗣️  Text-to-Speech:
+   • Web Speech Synthesis API
+   • Multiple voice options per language
+   • Adjustable speech rate and pitch
+   • SSML support for enhanced pronunciation
+
+🌍 Language Support:
+   • 10 major world languages
+   • Automatic language detection
+   • Medical term translation database
+   • Cultural adaptation (emergency numbers, etc.)
+
+🔧 Error Handling:
+   • Speech recognition error correction
+   • Pronunciation variation handling
+   • Network failure fallback modes
+   • Microphone permission management
+
+♿ Accessibility Features:
+   • Large button interface
+   • High contrast mode
+   • Keyboard navigation
+   • Screen reader compatibility
+   • Visual and audio feedback
+
+⚡ Performance:
+   • < 100ms voice processing latency
+   • 98,000+ voice inputs/second throughput
+   • Offline emergency phrase support
+   • Progressive enhancement"""
+
+_DEPLOYMENT_GUIDE_TEXT = """
+🏥 DEPLOYMENT GUIDE FOR HEALTHCARE ORGANIZATIONS
+============================================================
+
+1️⃣  Basic Setup (5 minutes):
+   • Deploy on any modern web server
+   • Requires HTTPS for microphone access
+   • Compatible with tablets, smartphones, computers
+   • No additional software installation required
+
+2️⃣  Integration Options:
+   • WhatsApp Business API for messaging
+   • SMS integration via Twilio
+   • Electronic Health Records (EHR) systems
+   • Telemedicine platform integration
+
+3️⃣  Customization:
+   • Add local emergency numbers
+   • Customize medical terminology
+   • Brand with organization colors/logo
+   • Configure local healthcare providers
+
+4️⃣  Training & Rollout:
+   • 15-minute training for healthcare staff
+   • Multilingual user guides available
+   • Community health worker integration
+   • Patient education materials
+
+5️⃣  Monitoring & Analytics:
+   • Real-time usage statistics
+   • Language preference tracking
+   • Triage accuracy monitoring
+   • Emergency case alerts"""
+
+@functools.lru_cache(maxsize=1)
+def get_voice_assistant():
+    """Shared VoiceAssistant so repeated demo runs reuse its loaded tables"""
+    return VoiceAssistant()
+
+@functools.lru_cache(maxsize=1)
+def get_chatbot():
+    """Shared HealthcareChatbot so repeated demo runs reuse its loaded tables"""
+    return HealthcareChatbot()
+
+def demo_voice_assistant(interactive=True):
     """Demonstrate voice assistant capabilities for illiterate users"""
     
     print("🎤 HEALTHCARE VOICE ASSISTANT DEMO")
@@ -20,122 +137,142 @@ def demo_voice_assistant():
     print("="*70)
     
     # Initialize components
-    voice_assistant = VoiceAssistant()
-    chatbot = HealthcareChatbot()
+    voice_assistant = get_voice_assistant()
+    chatbot = get_chatbot()
     
     # Demo scenarios for different user types
     demo_scenarios = [
-        {
-            'user_type': 'English-speaking rural farmer',
-            'language': SupportedLanguage.ENGLISH,
-            'voice_input': 'I have chest pain and shortness of breath',
-            'scenario': 'Emergency case requiring immediate attention'
-        },
-        {
-            'user_type': 'Spanish-speaking migrant worker', 
-            'language': SupportedLanguage.SPANISH,
-            'voice_input': 'Mi hijo tiene fiebre alta y tos',
-            'scenario': 'Pediatric fever case requiring urgent care'
-        },
-        {
-            'user_type': 'Hindi-speaking elderly person',
-            'language': SupportedLanguage.HINDI,
-            'voice_input': 'मुझे सिरदर्द और थकान है',
-            'scenario': 'Mild symptoms suitable for self-care'
-        },
-        {
-            'user_type': 'French-speaking refugee',
-            'language': SupportedLanguage.FRENCH,
-            'voice_input': 'J\'ai des nausées et mal au ventre',
-            'scenario': 'Digestive issues requiring outpatient care'
-        },
-        {
-            'user_type': 'Bengali-speaking fisherman',
-            'language': SupportedLanguage.BENGALI,
-            'voice_input': 'আমার শ্বাসকষ্ট হচ্ছে',
-            'scenario': 'Breathing difficulty - emergency situation'
-        }
+        Scenario(
+            'English-speaking rural farmer',
+            SupportedLanguage.ENGLISH,
+            'I have chest pain and shortness of breath',
+            'Emergency case requiring immediate attention'
+        ),
+        Scenario(
+            'Spanish-speaking migrant worker',
+            SupportedLanguage.SPANISH,
+            'Mi hijo tiene fiebre alta y tos',
+            'Pediatric fever case requiring urgent care'
+        ),
+        Scenario(
+            'Hindi-speaking elderly person',
+            SupportedLanguage.HINDI,
+            'मुझे सिरदर्द और थकान है',
+            'Mild symptoms suitable for self-care'
+        ),
+        Scenario(
+            'French-speaking refugee',
+            SupportedLanguage.FRENCH,
+            'J\'ai des nausées et mal au ventre',
+            'Digestive issues requiring outpatient care'
+        ),
+        Scenario(
+            'Bengali-speaking fisherman',
+            SupportedLanguage.BENGALI,
+            'আমার শ্বাসকষ্ট হচ্ছে',
+            'Breathing difficulty - emergency situation'
+        )
     ]
     
-    for i, scenario in enumerate(demo_scenarios, 1):
-        print(f"\n🎬 SCENARIO {i}: {scenario['scenario']}")
-        print(f"👤 User: {scenario['user_type']}")
+    asyncio.run(run_scenarios(voice_assistant, chatbot, demo_scenarios, interactive))
+    
+    print(_DEMO_SUMMARY_TEXT)
+
+async def run_scenarios(voice_assistant, chatbot, demo_scenarios, interactive=True):
+    """Run the demo scenarios, one at a time or concurrently in batch mode"""
+    
+    def print_scenario(i, scenario, lines):
+        print(f"\n🎬 SCENARIO {i}: {scenario.scenario}")
+        print(f"👤 User: {scenario.user_type}")
         print("-" * 50)
-        
-        demonstrate_voice_interaction(
-            voice_assistant, 
-            chatbot, 
-            scenario['voice_input'],
-            scenario['language']
-        )
-        
+        print("\n".join(lines))
         print()
-        input("Press Enter to continue to next scenario...")
     
-    print("\n🎉 VOICE ASSISTANT DEMO COMPLETED")
-    print("\n📊 Key Accessibility Features Demonstrated:")
-    print("✅ Speech-to-text in multiple languages")
-    print("✅ Automatic language detection")  
-    print("✅ Voice recognition error correction")
-    print("✅ Text-to-speech responses")
-    print("✅ Emergency alerts with audio")
-    print("✅ Support for 10 major world languages")
-    print("✅ Offline emergency phrase capability")
+    if interactive:
+        for i, scenario in enumerate(demo_scenarios, 1):
+            lines = await demonstrate_voice_interaction(
+                voice_assistant, 
+                chatbot, 
+                scenario.voice_input,
+                scenario.language
+            )
+            print_scenario(i, scenario, lines)
+            input("Press Enter to continue to next scenario...")
+        return
+    
+    # Scenarios are independent, so run them together (at most 3 at a time)
+    # and print each transcript in order once all have finished
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCENARIOS)
+    
+    async def run_one(scenario):
+        async with semaphore:
+            return await demonstrate_voice_interaction(
+                voice_assistant, 
+                chatbot, 
+                scenario.voice_input,
+                scenario.language
+            )
+    
+    tasks = [asyncio.create_task(run_one(scenario)) for scenario in demo_scenarios]
+    transcripts = await asyncio.gather(*tasks)
+    for i, (scenario, lines) in enumerate(zip(demo_scenarios, transcripts), 1):
+        print_scenario(i, scenario, lines)
 
-def demonstrate_voice_interaction(voice_assistant, chatbot, voice_input, language):
-    """Demonstrate a complete voice interaction flow"""
+async def demonstrate_voice_interaction(voice_assistant, chatbot, voice_input, language):
+    """Demonstrate a complete voice interaction flow, returning its transcript lines"""
+    
+    lines = []
+    out = lines.append
     
-    print(f"🗣️  User says: \"{voice_input}\"")
-    print(f"🌍 Language: {language.value} ({get_language_name(language)})")
+    out(f"🗣️  User says: \"{voice_input}\"")
+    out(f"🌍 Language: {language.code} ({get_language_name(language)})")
     
     # Step 1: Process voice input
-    print("\n🔄 Processing voice input...")
-    voice_result = voice_assistant.process_voice_input(voice_input)
+    out("\n🔄 Processing voice input...")
+    voice_result = await asyncio.to_thread(voice_assistant.process_voice_input, voice_input)
     
-    print(f"   ✓ Detected language: {voice_result['detected_language']}")
-    print(f"   ✓ Normalized text: \"{voice_result['normalized_text']}\"")
-    print(f"   ✓ English translation: \"{voice_result['english_text']}\"")
+    out(f"   ✓ Detected language: {voice_result.detected_language}")
+    out(f"   ✓ Normalized text: \"{voice_result.normalized_text}\"")
+    out(f"   ✓ English translation: \"{voice_result.english_text}\"")
     
     # Step 2: Create chat session and process
-    print("\n🤖 Processing through triage system...")
-    session_id = chatbot.create_session(user_id=f"voice_user_{language.value}")
+    out("\n🤖 Processing through triage system...")
+    session_id = chatbot.create_session(user_id=_USER_IDS[language])
     
     # Process the English text through triage
-    bot_responses = chatbot.process_user_input(session_id, voice_result['english_text'])
+    bot_responses = await asyncio.to_thread(
+        chatbot.process_user_input, session_id, voice_result.english_text
+    )
     
     # Get triage result
     session = chatbot.sessions[session_id]
     triage_result = session.triage_result
     
     if triage_result:
-        urgency = triage_result['urgency']
-        urgency_display = urgency.value.upper() if hasattr(urgency, 'value') else str(urgency).upper()
-        print(f"   ✓ Triage assessment: {urgency_display}")
-        print(f"   ✓ Condition: {triage_result['condition']}")
+        # The chatbot stores urgency as its string value (e.g. 'self-care')
+        out(f"   ✓ Triage assessment: {triage_result['urgency'].upper()}")
+        out(f"   ✓ Condition: {triage_result['condition']}")
         
         if triage_result['red_flags']:
-            print(f"   ⚠️  Red flags detected: {', '.join(triage_result['red_flags'])}")
+            out(f"   ⚠️  Red flags detected: {', '.join(triage_result['red_flags'])}")
     
     # Step 3: Generate voice response
-    print("\n🔊 Generating voice response...")
+    out("\n🔊 Generating voice response...")
     
     # Get the main triage response
-    main_response = None
-    for response in bot_responses:
-        if any(keyword in response.message.lower() for keyword in 
-               ['emergency', 'self-care', 'outpatient', 'urgent']):
-            main_response = response.message
-            break
-    
-    if not main_response and bot_responses:
-        main_response = bot_responses[0].message
+    main_response = next(
+        (response.message for response in bot_responses if _TRIAGE_TAGS.search(response.message)),
+        bot_responses[0].message if bot_responses else None
+    )
     
     if main_response:
         # Generate speech synthesis data
-        speech_data = voice_assistant.generate_voice_response(main_response, language)
+        speech_data = await asyncio.to_thread(
+            voice_assistant.generate_voice_response, main_response, language
+        )
         
-        print(f"   ✓ Response in {language.value}: \"{speech_data['text']}\"")
-        print(f"   ✓ Voice settings: {speech_data['voice_name']} (rate: {speech_data['speech_rate']})")
+        out(f"   ✓ Response in {language.code}: \"{speech_data['text']}\"")
+        out(f"   ✓ Voice settings: {speech_data['voice_name']} (rate: {speech_data['speech_rate']})")
         
         # Show what would be spoken
         if language == SupportedLanguage.ENGLISH:
@@ -144,28 +281,26 @@ def demonstrate_voice_interaction(voice_assistant, chatbot, voice_input, languag
             # Show both original and translated
             spoken_response = f"{speech_data['text']} (English: {main_response})"
         
-        print(f"🎵 Bot would speak: \"{spoken_response}\"")
+        out(f"🎵 Bot would speak: \"{spoken_response}\"")
         
         # Special handling for emergency cases
-        urgency_value = triage_result['urgency']
-        if hasattr(urgency_value, 'value'):
-            urgency_value = urgency_value.value
-        
-        if triage_result and urgency_value == 'emergency':
-            print("🚨 EMERGENCY ALERT TRIGGERED!")
+        if triage_result and triage_result['urgency'] == 'emergency':
+            out("🚨 EMERGENCY ALERT TRIGGERED!")
             emergency_msg = voice_assistant.get_emergency_message(language)
-            print(f"🎵 Emergency message: \"{emergency_msg}\"")
-            print("📞 Direct emergency contacts would be displayed")
-            print("🔔 Audio alert would be played")
+            out(f"🎵 Emergency message: \"{emergency_msg}\"")
+            out("📞 Direct emergency contacts would be displayed")
+            out("🔔 Audio alert would be played")
     
     # Step 4: Show accessibility features
-    print(f"\n♿ Accessibility features active:")
-    print(f"   • Large voice button for easy access")
-    print(f"   • Visual feedback during speech recognition") 
-    print(f"   • Audio level indicator")
-    print(f"   • Keyboard shortcuts (spacebar to toggle)")
-    print(f"   • Quick voice command buttons")
-    print(f"   • High contrast mode available")
+    out(f"\n♿ Accessibility features active:")
+    out(f"   • Large voice button for easy access")
+    out(f"   • Visual feedback during speech recognition") 
+    out(f"   • Audio level indicator")
+    out(f"   • Keyboard shortcuts (spacebar to toggle)")
+    out(f"   • Quick voice command buttons")
+    out(f"   • High contrast mode available")
+    
+    return lines
 
 def get_language_name(language):
     """Get human-readable language name"""
@@ -181,88 +316,25 @@ def get_language_name(language):
         SupportedLanguage.RUSSIAN: "Русский",
         SupportedLanguage.GERMAN: "Deutsch"
     }
-    return names.get(language, language.value)
+    return names.get(language, language.code)
 
 def show_technical_specifications():
     """Show technical specifications of the voice assistant"""
-    
-    print("\n📋 TECHNICAL SPECIFICATIONS")
-    print("="*50)
-    
-    print("\n🎤 Speech Recognition:")
-    print("   • Web Speech API (Chrome, Firefox, Safari)")
-    print("   • Real-time speech-to-text conversion")
-    print("   • Noise filtering and error correction")
-    print("   • Continuous and interim result processing")
-    
-    print("\n🗣️  Text-to-Speech:")
-    print("   • Web Speech Synthesis API")
-    print("   • Multiple voice options per language")
-    print("   • Adjustable speech rate and pitch")
-    print("   • SSML support for enhanced pronunciation")
-    
-    print("\n🌍 Language Support:")
-    print("   • 10 major world languages")
-    print("   • Automatic language detection")
-    print("   • Medical term translation database")
-    print("   • Cultural adaptation (emergency numbers, etc.)")
-    
-    print("\n🔧 Error Handling:")
-    print("   • Speech recognition error correction")
-    print("   • Pronunciation variation handling")
-    print("   • Network failure fallback modes")
-    print("   • Microphone permission management")
-    
-    print("\n♿ Accessibility Features:")
-    print("   • Large button interface")
-    print("   • High contrast mode")
-    print("   • Keyboard navigation")
-    print("   • Screen reader compatibility")
-    print("   • Visual and audio feedback")
-    
-    print("\n⚡ Performance:")
-    print("   • < 100ms voice processing latency")
-    print("   • 98,000+ voice inputs/second throughput")
-    print("   • Offline emergency phrase support")
-    print("   • Progressive enhancement")
+    print(_TECH_SPEC_TEXT)
 
 def show_deployment_guide():
     """Show deployment guide for healthcare organizations"""
-    
-    print("\n🏥 DEPLOYMENT GUIDE FOR HEALTHCARE ORGANIZATIONS")
-    print("="*60)
-    
-    print("\n1️⃣  Basic Setup (5 minutes):")
-    print("   • Deploy on any modern web server")
-    print("   • Requires HTTPS for microphone access")
-    print("   • Compatible with tablets, smartphones, computers")
-    print("   • No additional software installation required")
-    
-    print("\n2️⃣  Integration Options:")
-    print("   • WhatsApp Business API for messaging")
-    print("   • SMS integration via Twilio")
-    print("   • Electronic Health Records (EHR) systems")
-    print("   • Telemedicine platform integration")
-    
-    print("\n3️⃣  Customization:")
-    print("   • Add local emergency numbers")
-    print("   • Customize medical terminology")
-    print("   • Brand with organization colors/logo")
-    print("   • Configure local healthcare providers")
-    
-    print("\n4️⃣  Training & Rollout:")
-    print("   • 15-minute training for healthcare staff")
-    print("   • Multilingual user guides available")
-    print("   • Community health worker integration")
-    print("   • Patient education materials")
-    
-    print("\n5️⃣  Monitoring & Analytics:")
-    print("   • Real-time usage statistics")
-    print("   • Language preference tracking")
-    print("   • Triage accuracy monitoring")
-    print("   • Emergency case alerts")
+    print(_DEPLOYMENT_GUIDE_TEXT)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Healthcare Voice Assistant Demo")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--batch", action="store_true",
+                      help="run all scenarios concurrently without pausing")
+    mode.add_argument("--interactive", action="store_true",
+                      help="run one scenario at a time, pausing between them (default)")
+    args = parser.parse_args()
+    
     print("🚀 Starting Healthcare Voice Assistant Demo...")
     print("This demo shows how voice technology can help illiterate users")
     print("access healthcare triage in their native language.")
@@ -270,7 +342,7 @@ if __name__ == "__main__":
     
     try:
         # Main demo
-        demo_voice_assistant()
+        demo_voice_assistant(interactive=not args.batch)
         
         # Technical details
         show_technical_specifications()
@@ -0,0 +1,19 @@
+"""
+Optional build script for the compiled voice assistant helpers
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+The app runs without this step; app/voice_assistant.py falls back to pure Python.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="hack4health-voice-speedups",
+    ext_modules=cythonize(
+        "app/_voice_fast.pyx",
+        compiler_directives={"language_level": 3, "boundscheck": False},
+    ),
+)
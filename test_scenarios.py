@@ -6,13 +6,34 @@ Tests the bot with the example scenarios from the hackathon requirements
 
 import sys
 import os
+from dataclasses import dataclass
+from typing import NamedTuple
 sys.path.append(os.path.dirname(__file__))
 
-from app.triage_engine import TriageEngine, UrgencyLevel
+from app.triage_engine import TriageEngine, TriageResult, UrgencyLevel
 from app.chatbot import HealthcareChatbot
 
-def test_triage_engine():
-    """Test the core triage engine with example scenarios"""
+class TestCase(NamedTuple):
+    __test__ = False  # Not a pytest test class
+    
+    name: str
+    input: str
+    expected_urgency: UrgencyLevel
+    description: str
+
+@dataclass(slots=True)
+class TestResult:
+    __test__ = False  # Not a pytest test class
+    
+    name: str
+    input: str
+    expected: UrgencyLevel
+    actual: UrgencyLevel
+    passed: bool
+    result: TriageResult
+
+def run_triage_scenarios():
+    """Run the core triage engine on the example scenarios and report each result"""
     print("="*60)
     print("HEALTHCARE TRIAGE BOT - SCENARIO TESTING")
     print("="*60)
@@ -21,63 +42,63 @@ def test_triage_engine():
     
     # Test cases from hackathon requirements
     test_cases = [
-        {
-            'name': 'Mild Case',
-            'input': "I have a mild headache and slight fatigue.",
-            'expected_urgency': UrgencyLevel.SELF_CARE,
-            'description': "Should recommend self-care with home remedies"
-        },
-        {
-            'name': 'Moderate Case',
-            'input': "I've had fever for 3 days and sore throat.",
-            'expected_urgency': UrgencyLevel.OUTPATIENT,
-            'description': "Should recommend clinic/telemedicine consultation"
-        },
-        {
-            'name': 'Emergency Case - Adult',
-            'input': "I have severe chest pain and difficulty breathing.",
-            'expected_urgency': UrgencyLevel.EMERGENCY,
-            'description': "Should trigger emergency alert and call 911/108"
-        },
-        {
-            'name': 'Emergency Case - Pediatric',
-            'input': "My child has high fever, cough, and difficulty breathing.",
-            'expected_urgency': UrgencyLevel.EMERGENCY,
-            'description': "Should trigger emergency alert for child"
-        },
+        TestCase(
+            'Mild Case',
+            "I have a mild headache and slight fatigue.",
+            UrgencyLevel.SELF_CARE,
+            "Should recommend self-care with home remedies"
+        ),
+        TestCase(
+            'Moderate Case',
+            "I've had fever for 3 days and sore throat.",
+            UrgencyLevel.OUTPATIENT,
+            "Should recommend clinic/telemedicine consultation"
+        ),
+        TestCase(
+            'Emergency Case - Adult',
+            "I have severe chest pain and difficulty breathing.",
+            UrgencyLevel.EMERGENCY,
+            "Should trigger emergency alert and call 911/108"
+        ),
+        TestCase(
+            'Emergency Case - Pediatric',
+            "My child has high fever, cough, and difficulty breathing.",
+            UrgencyLevel.EMERGENCY,
+            "Should trigger emergency alert for child"
+        ),
         # Additional test cases
-        {
-            'name': 'Urgent Case',
-            'input': "I have severe abdominal pain that started suddenly.",
-            'expected_urgency': UrgencyLevel.URGENT,
-            'description': "Should recommend urgent care within 24 hours"
-        },
-        {
-            'name': 'Multiple Symptoms',
-            'input': "I have nausea, mild stomach pain, and heartburn after eating.",
-            'expected_urgency': UrgencyLevel.OUTPATIENT,
-            'description': "Should categorize as digestive outpatient condition"
-        }
+        TestCase(
+            'Urgent Case',
+            "I have severe abdominal pain that started suddenly.",
+            UrgencyLevel.URGENT,
+            "Should recommend urgent care within 24 hours"
+        ),
+        TestCase(
+            'Multiple Symptoms',
+            "I have nausea, mild stomach pain, and heartburn after eating.",
+            UrgencyLevel.OUTPATIENT,
+            "Should categorize as digestive outpatient condition"
+        )
     ]
     
     results = []
     
     for i, test_case in enumerate(test_cases, 1):
-        print(f"\nTest Case {i}: {test_case['name']}")
+        print(f"\nTest Case {i}: {test_case.name}")
         print("-" * 40)
-        print(f"Input: \"{test_case['input']}\"")
-        print(f"Expected: {test_case['expected_urgency'].value}")
-        print(f"Description: {test_case['description']}")
+        print(f"Input: \"{test_case.input}\"")
+        print(f"Expected: {test_case.expected_urgency.value}")
+        print(f"Description: {test_case.description}")
         
         # Run triage
-        result = engine.triage(test_case['input'])
+        result = engine.triage(test_case.input)
         
         print(f"Actual: {result.urgency.value}")
         print(f"Condition: {result.condition}")
         print(f"Confidence: {result.confidence:.2f}")
         
         # Check if result matches expectation
-        passed = result.urgency == test_case['expected_urgency']
+        passed = result.urgency == test_case.expected_urgency
         status = "✅ PASS" if passed else "❌ FAIL"
         print(f"Status: {status}")
         
@@ -92,21 +113,21 @@ def test_triage_engine():
         for step in result.next_steps:
             print(f"  • {step}")
         
-        results.append({
-            'name': test_case['name'],
-            'input': test_case['input'],
-            'expected': test_case['expected_urgency'],
-            'actual': result.urgency,
-            'passed': passed,
-            'result': result
-        })
+        results.append(TestResult(
+            name=test_case.name,
+            input=test_case.input,
+            expected=test_case.expected_urgency,
+            actual=result.urgency,
+            passed=passed,
+            result=result
+        ))
     
     # Summary
     print("\n" + "="*60)
     print("TEST SUMMARY")
     print("="*60)
     
-    passed_count = sum(1 for r in results if r['passed'])
+    passed_count = sum(1 for r in results if r.passed)
     total_count = len(results)
     
     print(f"Total Tests: {total_count}")
@@ -115,14 +136,35 @@ def test_triage_engine():
     print(f"Success Rate: {(passed_count/total_count)*100:.1f}%")
     
     # Failed tests detail
-    failed_tests = [r for r in results if not r['passed']]
+    failed_tests = [r for r in results if not r.passed]
     if failed_tests:
         print(f"\nFailed Tests:")
         for test in failed_tests:
-            print(f"  • {test['name']}: Expected {test['expected'].value}, got {test['actual'].value}")
+            print(f"  • {test.name}: Expected {test.expected.value}, got {test.actual.value}")
     
     return results
 
+def test_triage_engine():
+    """Test the core triage engine with example scenarios"""
+    failed = [r.name for r in run_triage_scenarios() if not r.passed]
+    assert not failed, f"Unexpected urgency for: {', '.join(failed)}"
+
+def test_triage_batch_matches_triage():
+    """triage_batch gives exactly the per-text triage() results"""
+    engine = TriageEngine()
+    texts = [
+        "I have a mild headache and slight fatigue.",
+        "I've had fever for 3 days and sore throat.",
+        "I have severe chest pain and difficulty breathing.",
+        "My child has high fever, cough, and difficulty breathing.",
+        "I have severe abdominal pain that started suddenly.",
+        "I have nausea, mild stomach pain, and heartburn after eating.",
+        "severe bleeding from cut",
+        "rash and itchy skin",
+        "",
+    ]
+    assert engine.triage_batch(texts) == [engine.triage(text) for text in texts]
+
 def test_chatbot_integration():
     """Test the full chatbot integration"""
     print("\n" + "="*60)
@@ -164,6 +206,90 @@ def test_chatbot_integration():
     print(f"  Status: {summary['status']}")
     if summary['triage_result']:
         print(f"  Triage: {summary['triage_result']['urgency']} - {summary['triage_result']['condition']}")
+    
+    assert summary['message_count'] > len(test_conversations)
+    assert summary['triage_result'] is not None
+
+def test_session_lru_eviction(monkeypatch):
+    """Past MAX_SESSIONS the least recently used session is dropped"""
+    monkeypatch.setattr(HealthcareChatbot, 'MAX_SESSIONS', 2)
+    chatbot = HealthcareChatbot()
+    
+    first = chatbot.create_session()
+    second = chatbot.create_session()
+    chatbot.process_user_input(first, "I have a mild headache")  # second is now least recent
+    third = chatbot.create_session()
+    
+    assert list(chatbot.sessions) == [first, third]
+    assert not chatbot.has_session(second)
+
+def test_all_sessions_tolerates_concurrent_activity():
+    """Listing sessions survives a chat message reordering the LRU mid-listing"""
+    chatbot = HealthcareChatbot()
+    first = chatbot.create_session()
+    second = chatbot.create_session()
+    
+    summarize = chatbot.get_session_summary
+    def summarize_during_chat(session_id):
+        if session_id == first:
+            chatbot.process_user_input(first, "I have a mild headache")  # moves first to the end
+        return summarize(session_id)
+    chatbot.get_session_summary = summarize_during_chat
+    
+    summaries = chatbot.get_all_sessions()
+    assert [summary['session_id'] for summary in summaries] == [first, second]
+
+def test_triage_memo_invalidation():
+    """Repeated input reuses the session's triage; new input or language reassesses"""
+    chatbot = HealthcareChatbot()
+    calls = []
+    triage = chatbot.triage_engine.triage
+    def counting_triage(text):
+        calls.append(text)
+        return triage(text)
+    chatbot.triage_engine.triage = counting_triage
+    
+    session_id = chatbot.create_session()
+    chatbot.process_user_input(session_id, "I have a mild headache")
+    chatbot.process_user_input(session_id, "I have a mild headache")
+    assert calls == ["I have a mild headache"]
+    
+    chatbot.process_user_input(session_id, "I have severe chest pain")
+    assert calls == ["I have a mild headache", "I have severe chest pain"]
+    assert chatbot.sessions[session_id].triage_result['urgency'] == triage("I have severe chest pain").urgency_str
+    
+    chatbot.set_language('es')
+    try:
+        chatbot.process_user_input(session_id, "I have severe chest pain")
+    finally:
+        chatbot.set_language('en')  # set_language also switches the shared i18n instance
+    assert len(calls) == 3
+
+def test_whatsapp_webhook_emergency():
+    """Emergency replies reach WhatsApp as one prefixed <Body> per message"""
+    import xml.etree.ElementTree as ET
+    from app.integrations import MessagingIntegration
+    
+    chatbot = HealthcareChatbot()
+    integration = MessagingIntegration(chatbot)
+    twiml = integration.handle_whatsapp_webhook({
+        'From': 'whatsapp:+15550001111',
+        'Body': "I have severe chest pain and difficulty breathing"
+    })
+    
+    message_nodes = ET.fromstring(twiml).findall('Message')
+    session = chatbot.sessions[integration.get_or_create_session('whatsapp:+15550001111')]
+    # The bot's replies are the last messages of the session, in send order
+    replies = session.messages[-len(message_nodes):]
+    assert all(reply.sender == 'bot' for reply in replies)
+    for message_node, reply in zip(message_nodes, replies):
+        bodies = message_node.findall('Body')
+        assert len(bodies) == 1
+        expected = f"🚨 {reply.message}" if reply.is_emergency else reply.message
+        assert bodies[0].text == expected
+    
+    flagged = [reply.message for reply in replies if reply.is_emergency]
+    assert any("Call 911 (US) or 108 (India)" in text for text in flagged)
 
 def performance_test():
     """Test performance with multiple scenarios"""
@@ -171,6 +297,8 @@ def performance_test():
     print("PERFORMANCE TESTING")
     print("="*60)
     
+    import gc
+    import statistics
     import time
     
     engine = TriageEngine()
@@ -189,20 +317,31 @@ def performance_test():
     
     print(f"Testing {len(scenarios)} scenarios...")
     
-    start_time = time.time()
-    results = []
-    
-    for scenario in scenarios:
-        result = engine.triage(scenario)
-        results.append(result)
+    # Keep garbage collection pauses out of the measurements
+    gc.disable()
+    try:
+        start_time = time.perf_counter_ns()
+        results = engine.triage_batch(scenarios)
+        end_time = time.perf_counter_ns()
+        
+        # Per-call latencies to expose the tail that the mean hides
+        latencies = []
+        for scenario in scenarios:
+            call_start = time.perf_counter_ns()
+            engine.triage(scenario)
+            latencies.append(time.perf_counter_ns() - call_start)
+    finally:
+        gc.enable()
     
-    end_time = time.time()
-    total_time = end_time - start_time
-    avg_time = total_time / len(scenarios)
+    total_ns = end_time - start_time
+    total_time = total_ns / 1e9
+    percentiles = statistics.quantiles(latencies, n=100)
     
-    print(f"Total time: {total_time:.2f} seconds")
-    print(f"Average time per triage: {avg_time*1000:.1f} ms")
+    print(f"Total time: {total_ns/1e6:.3f} ms")
+    print(f"Average time per triage: {total_ns/len(scenarios)/1e6:.3f} ms")
     print(f"Throughput: {len(scenarios)/total_time:.1f} triages/second")
+    print(f"Single-call latency: p50 {percentiles[49]/1e6:.3f} ms, "
+          f"p95 {percentiles[94]/1e6:.3f} ms, p99 {percentiles[98]/1e6:.3f} ms")
     
     # Count urgency levels
     urgency_counts = {}
@@ -219,40 +358,34 @@ if __name__ == "__main__":
     # Run all tests
     print("Starting Healthcare Triage Bot Testing...")
     
-    try:
-        # Test 1: Core triage engine
-        test_results = test_triage_engine()
-        
-        # Test 2: Chatbot integration
-        test_chatbot_integration()
-        
-        # Test 3: Performance
-        performance_test()
-        
-        print("\n" + "="*60)
-        print("ALL TESTS COMPLETED")
-        print("="*60)
-        
-        # Final assessment
-        passed_core_tests = sum(1 for r in test_results if r['passed'])
-        total_core_tests = len(test_results)
-        
-        if passed_core_tests == total_core_tests:
-            print("✅ All core triage tests PASSED!")
-            print("✅ System is ready for demonstration")
-        else:
-            print(f"⚠️  {total_core_tests - passed_core_tests} core tests failed")
-            print("⚠️  Review triage logic before demonstration")
-        
-        print("\nKey Features Demonstrated:")
-        print("• Symptom analysis and triage classification")
-        print("• Emergency detection and alerts")
-        print("• Conversational interface")
-        print("• Clinician review dashboard")
-        print("• Multi-channel integration hooks")
-        print("• Offline capability framework")
-        
-    except Exception as e:
-        print(f"❌ Testing failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+    # Test 1: Core triage engine
+    test_results = run_triage_scenarios()
+    
+    # Test 2: Chatbot integration
+    test_chatbot_integration()
+    
+    # Test 3: Performance
+    performance_test()
+    
+    print("\n" + "="*60)
+    print("ALL TESTS COMPLETED")
+    print("="*60)
+    
+    # Final assessment
+    passed_core_tests = sum(1 for r in test_results if r.passed)
+    total_core_tests = len(test_results)
+    
+    if passed_core_tests == total_core_tests:
+        print("✅ All core triage tests PASSED!")
+        print("✅ System is ready for demonstration")
+    else:
+        print(f"⚠️  {total_core_tests - passed_core_tests} core tests failed")
+        print("⚠️  Review triage logic before demonstration")
+    
+    print("\nKey Features Demonstrated:")
+    print("• Symptom analysis and triage classification")
+    print("• Emergency detection and alerts")
+    print("• Conversational interface")
+    print("• Clinician review dashboard")
+    print("• Multi-channel integration hooks")
+    print("• Offline capability framework")
@@ -4,19 +4,34 @@ Test script for Voice Assistant functionality
 Tests multilingual voice processing and speech synthesis
 """
 
+import argparse
+import functools
+import itertools
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 sys.path.append(os.path.dirname(__file__))
 
-from app.voice_assistant import VoiceAssistant, SupportedLanguage
+from app.voice_assistant import VoiceAssistant, SupportedLanguage, get_translator
+
+@functools.lru_cache(maxsize=1)
+def _get_assistant():
+    """One VoiceAssistant shared by every test"""
+    return VoiceAssistant()
+
+@pytest.fixture
+def assistant():
+    return _get_assistant()
 
-def test_voice_assistant():
-    """Test the voice assistant functionality"""
+def run_voice_assistant_tests():
+    """Run the core voice assistant tests on the shared assistant"""
     print("="*60)
     print("VOICE ASSISTANT - MULTILINGUAL TESTING")
     print("="*60)
     
-    assistant = VoiceAssistant()
+    assistant = _get_assistant()
     
     # Test language detection
     test_language_detection(assistant)
@@ -40,31 +55,52 @@ def test_language_detection(assistant):
         ("मुझे सीने में दर्द और सांस लेने में कठिनाई है", SupportedLanguage.HINDI),
         ("J'ai des douleurs thoraciques et des difficultés respiratoires", SupportedLanguage.FRENCH),
         ("У меня боль в груди и затрудненное дыхание", SupportedLanguage.RUSSIAN),
+        # Japanese with more kanji than kana
+        ("胸部痛と呼吸困難があります", SupportedLanguage.JAPANESE),
+        ("頭痛と発熱", SupportedLanguage.JAPANESE),
     ]
     
+    failures = []
     for phrase, expected_lang in test_phrases:
         detected = assistant.detect_language(phrase)
         status = "✅ PASS" if detected == expected_lang else "❌ FAIL"
-        print(f"{status} '{phrase[:30]}...' → {detected.value} (expected: {expected_lang.value})")
+        print(f"{status} '{phrase[:30]}...' → {detected.code} (expected: {expected_lang.code})")
+        if detected != expected_lang:
+            failures.append(phrase)
+    
+    assert not failures, f"Language misdetected for: {failures}"
 
 def test_voice_processing(assistant):
     """Test voice input processing and normalization"""
     print("\n--- Voice Input Processing Tests ---")
     
+    # (speech input, expected normalized text, expected English text, expected language)
     test_inputs = [
-        "I have chest pane and difficultly breathing",  # Common voice recognition errors
-        "My child has high fever and kogh",
-        "I feel dizzy and have head egg",
-        "Cannot breath properly since morning",
-        "Throwing up and stomach egg",
+        ("I have chest pane and difficultly breathing",  # Common voice recognition errors
+         "i have chest pain and difficulty breathing", "i have chest pain and difficulty breathing", "en"),
+        ("My child has high fever and kogh",
+         "my child has high fever and kogh", "my child has high fever and kogh", "en"),
+        ("I feel dizzy and have head egg",
+         "i feel dizzy and have headache", "i feel dizzy and have headache", "en"),
+        ("Cannot breath properly since morning",
+         "cannot breath properly since morning", "cannot breath properly since morning", "en"),
+        ("Throwing up and stomach egg",
+         "throwing up and stomach egg", "throwing up and stomach egg", "en"),
+        ("Tengo dolor de pecho y fiebre",
+         "tengo dolor en el pecho y fiebre", "tengo chest pain y fever", "es"),
+        ("सांस लेने में दिक्कत है",
+         "सांस लेने में कठिनाई है", "difficulty breathing है", "hi"),
     ]
     
-    for speech_input in test_inputs:
+    for speech_input, expected_normalized, expected_english, expected_lang in test_inputs:
         result = assistant.process_voice_input(speech_input)
         print(f"\nInput: '{speech_input}'")
-        print(f"Normalized: '{result['normalized_text']}'")
-        print(f"English: '{result['english_text']}'")
-        print(f"Language: {result['detected_language']} (confidence: {result['language_confidence']})")
+        print(f"Normalized: '{result.normalized_text}'")
+        print(f"English: '{result.english_text}'")
+        print(f"Language: {result.detected_language} (confidence: {result.language_confidence})")
+        assert result.normalized_text == expected_normalized
+        assert result.english_text == expected_english
+        assert result.detected_language == expected_lang
 
 def test_speech_synthesis(assistant):
     """Test speech synthesis data generation"""
@@ -75,6 +111,7 @@ def test_speech_synthesis(assistant):
         ("Esta es una emergencia médica", SupportedLanguage.SPANISH),
         ("यह एक चिकित्सा आपातकाल है", SupportedLanguage.HINDI),
         ("C'est une urgence médicale", SupportedLanguage.FRENCH),
+        ("You have chest pain and fever", SupportedLanguage.SPANISH),
     ]
     
     for text, language in test_responses:
@@ -84,10 +121,147 @@ def test_speech_synthesis(assistant):
         print(f"Voice: {speech_data['voice_name']}")
         print(f"Rate: {speech_data['speech_rate']}")
         print(f"Translated: '{speech_data['text']}'")
+        assert speech_data['language'] == language.code
+        assert speech_data['text'] == assistant.translator.translate_response(text, language.code)
+    
+    # Known English phrases are replaced in the target language
+    assert speech_data['text'] == "You have dolor en el pecho and fiebre"
+    
+    # ...but only as whole words, never inside inflected or compound words
+    assert assistant.translator.translate_response(
+        "You seem feverish and your headaches persist; fever and headache.", "es"
+    ) == "You seem feverish and your headaches persist; fiebre and dolor de cabeza."
+
+def test_ssml_escapes_text(assistant):
+    """Markup characters in the utterance stay text inside well-formed SSML"""
+    import xml.etree.ElementTree as ET
+    
+    text = "Take <2 tablets & rest > 1 hour </prosody><break/>"
+    ssml = assistant.generate_voice_response(text, SupportedLanguage.ENGLISH)['ssml']
+    
+    assert "&lt;2 tablets &amp; rest &gt; 1 hour &lt;/prosody&gt;&lt;break/&gt;" in ssml
+    root = ET.fromstring(ssml)
+    prosody = root.find("{http://www.w3.org/2001/10/synthesis}prosody")
+    assert prosody.text == text
+    assert len(prosody) == 0
+
+def test_synthesis_cache_evicts_least_recently_used():
+    """The in-memory synthesis cache drops the least recently used entry past max_entries"""
+    from app.voice_assistant import SynthesisCache
+    
+    cache = SynthesisCache(max_entries=2)
+    cache.set("a", {"text": "a"})
+    cache.set("b", {"text": "b"})
+    assert cache.get("a") == {"text": "a"}  # "b" is now least recently used
+    cache.set("c", {"text": "c"})
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == {"text": "a"}
+    assert cache.get("c") == {"text": "c"}
+
+def test_synthesize_route_serves_cache_hits(monkeypatch):
+    """Repeating a /api/voice/synthesize request reuses the cached speech data"""
+    from flask import Flask
+    from app.voice_assistant import setup_voice_routes
+    
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    calls = []
+    original = VoiceAssistant.generate_voice_response
+    def counting_generate(self, text, language):
+        calls.append((text, language))
+        return original(self, text, language)
+    monkeypatch.setattr(VoiceAssistant, "generate_voice_response", counting_generate)
+    
+    app = Flask(__name__)
+    setup_voice_routes(app)
+    client = app.test_client()
+    request = {'text': 'This is a medical emergency', 'language_code': 'es'}
+    first = client.post('/api/voice/synthesize', json=request).get_json()
+    second = client.post('/api/voice/synthesize', json=request).get_json()
+    
+    assert first['success'] and first == second
+    assert first['speech_data']['text'] == "Esta es una emergencia médica"
+    assert calls == [('This is a medical emergency', SupportedLanguage.SPANISH)]
+
+def test_voice_response_stream(assistant):
+    """Streaming splits Latin and CJK responses into sentences and yields nothing for blank text"""
+    import asyncio
+    
+    async def collect(text, language):
+        return [chunk async for chunk in assistant.generate_voice_response_stream(text, language)]
+    
+    latin = asyncio.run(collect("Call 911 now. Stay calm!  Help is coming? ", SupportedLanguage.ENGLISH))
+    assert [chunk['text'] for chunk in latin] == ["Call 911 now.", "Stay calm!", "Help is coming?"]
+    assert latin[0] == assistant.generate_voice_response("Call 911 now.", SupportedLanguage.ENGLISH)
+    
+    cjk = asyncio.run(collect("这是紧急情况。请拨打120！马上", SupportedLanguage.CHINESE))
+    assert [chunk['text'] for chunk in cjk] == ["这是紧急情况。", "请拨打120！", "马上"]
+    assert all(chunk['language'] == "zh" for chunk in cjk)
+    
+    assert asyncio.run(collect("   ", SupportedLanguage.ENGLISH)) == []
+
+def test_process_route_keeps_explicit_and_detected_language_apart(monkeypatch):
+    """An explicit English request and an auto-detect request for the same text are cached separately"""
+    from flask import Flask
+    from app.voice_assistant import setup_voice_routes
+    
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    app = Flask(__name__)
+    setup_voice_routes(app)
+    client = app.test_client()
+    
+    explicit = client.post('/api/voice/process', json={
+        'speech_text': "Tengo dolor de cabeza", 'language_code': 'en'
+    }).get_json()['result']
+    detected = client.post('/api/voice/process', json={
+        'speech_text': "Tengo dolor de cabeza"
+    }).get_json()['result']
+    
+    assert explicit['detected_language'] == 'en'
+    assert detected['detected_language'] == 'es'
+    assert detected['english_text'] == "tengo headache"
+    assert explicit != detected
+
+def test_process_voice_input_batch(assistant):
+    """Batch processing matches one process_voice_input call per input, in order"""
+    texts = [
+        "I have chest pane",
+        "Tengo dolor de pecho y fiebre",
+        "मुझे बुखार है",
+        "hola dolor",
+        "J'ai mal au ventre",
+        "I have chest pain",
+        "",
+    ]
+    languages = [None, None, None, SupportedLanguage.SPANISH, None, SupportedLanguage.FRENCH, None]
+    
+    expected = [assistant.process_voice_input(text, language) for text, language in zip(texts, languages)]
+    assert assistant.process_voice_input_batch(texts, languages) == expected
+    assert assistant.process_voice_input_batch(texts) == [assistant.process_voice_input(text) for text in texts]
+
+def test_process_voice_input_batch_length_mismatch(assistant):
+    """A languages list that does not line up with the inputs is rejected"""
+    with pytest.raises(ValueError):
+        assistant.process_voice_input_batch(["hola dolor", "b"], [None])
+
+def test_translation_matches_casefolded_speech(monkeypatch):
+    """Table phrases are folded like speech input, so ß and friends still match"""
+    from app import voice_assistant
+    
+    monkeypatch.setattr(voice_assistant, "_load_translations", lambda: {
+        "foot_pain": {"en": "foot pain", "de": "Fußschmerzen"},
+    })
+    translator = voice_assistant.LanguageTranslator()
+    
+    normalized = voice_assistant._normalize_speech("Ich habe FUSSSCHMERZEN", SupportedLanguage.GERMAN)
+    assert translator.translate_text(normalized, "de", "en") == "ich habe foot pain"
+    assert translator.translate_text("Ich habe Fußschmerzen", "de", "en") == "ich habe foot pain"
 
 def test_multilingual_support(assistant):
     """Test multilingual translation support"""
-    print("\n--- Multilingual Translation Tests ---")
+    lines = []
+    out = lines.append
+    out("\n--- Multilingual Translation Tests ---")
     
     # Test emergency phrases in different languages
     languages_to_test = [
@@ -98,117 +272,209 @@ def test_multilingual_support(assistant):
         SupportedLanguage.ARABIC,
         SupportedLanguage.CHINESE,
     ]
+    lang_pairs = [(lang, lang.code) for lang in languages_to_test]
     
-    print("Emergency messages in different languages:")
-    for lang in languages_to_test:
+    out("Emergency messages in different languages:")
+    for lang, code in lang_pairs:
         emergency_msg = assistant.get_emergency_message(lang)
-        print(f"{lang.value}: {emergency_msg}")
+        out(f"{code}: {emergency_msg}")
     
     # Test symptom translations
-    print("\nSymptom translations:")
+    out("\nSymptom translations:")
     symptoms = ['chest_pain', 'difficulty_breathing', 'fever', 'headache']
+    symptom_codes = [code for _, code in lang_pairs[:4]]  # Test first 4 languages
+    translations = assistant.translator.get_translations_bulk(symptoms, symptom_codes)
     
     for symptom in symptoms:
-        print(f"\n{symptom.replace('_', ' ').title()}:")
-        for lang in languages_to_test[:4]:  # Test first 4 languages
-            translation = assistant.translator.get_translation(symptom, lang.value)
-            print(f"  {lang.value}: {translation}")
+        out(f"\n{symptom.replace('_', ' ').title()}:")
+        for code in symptom_codes:
+            out(f"  {code}: {translations[symptom, code]}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    assert len(translations) == len(symptoms) * len(symptom_codes)
 
-def test_voice_error_handling():
+def test_voice_error_handling(assistant):
     """Test voice assistant error handling"""
     print("\n--- Error Handling Tests ---")
     
-    assistant = VoiceAssistant()
-    
     # Test empty input
     result = assistant.process_voice_input("")
-    print(f"Empty input handling: {result['english_text'] if result['english_text'] else 'Handled correctly'}")
+    print(f"Empty input handling: {result.english_text if result.english_text else 'Handled correctly'}")
+    assert result.english_text == ""
     
     # Test nonsensical input
     result = assistant.process_voice_input("xyz abc random words")
-    print(f"Random input: '{result['english_text']}' → Language: {result['detected_language']}")
+    print(f"Random input: '{result.english_text}' → Language: {result.detected_language}")
     
     # Test very long input
     long_input = "I have pain " * 50
     result = assistant.process_voice_input(long_input)
-    print(f"Long input handling: {len(result['english_text'])} characters processed")
+    print(f"Long input handling: {len(result.english_text)} characters processed")
+    assert len(result.english_text) == len(long_input.strip())
 
-def test_accessibility_features():
+def test_accessibility_features(assistant):
     """Test accessibility-related features"""
-    print("\n--- Accessibility Features Tests ---")
-    
-    assistant = VoiceAssistant()
+    lines = []
+    out = lines.append
+    out("\n--- Accessibility Features Tests ---")
     
     # Test supported languages
-    languages = assistant.get_supported_languages()
-    print(f"Supported languages: {len(languages)}")
+    languages = assistant.supported_languages
+    out(f"Supported languages: {len(languages)}")
     for lang in languages:
-        print(f"  {lang['code']}: {lang['name']}")
+        out(f"  {lang['code']}: {lang['name']}")
     
     # Test voice configurations
-    print("\nVoice configurations:")
-    for lang, config in assistant.voice_configs.items():
-        print(f"  {lang.value}: {config.voice_name} (rate: {config.speech_rate})")
+    out("\nVoice configurations:")
+    for config in assistant.voice_configs:
+        out(f"  {config.language.code}: {config.voice_name} (rate: {config.speech_rate})")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    assert len(languages) == len(SupportedLanguage)
+    
+    # Callers get their own copy of the list
+    copy = assistant.get_supported_languages()
+    copy.reverse()
+    copy[0]['name'] = "changed"
+    assert assistant.get_supported_languages()[0] == languages[0]
+    assert languages[-1]['name'] != "changed"
+    
+    # The shared entries themselves cannot be edited
+    with pytest.raises(TypeError):
+        languages[0]['name'] = "changed"
+
+def _shared_translator_worker(text):
+    """Runs in a spawned worker: attach to the published translator and use it"""
+    from app import voice_assistant
+    shm_name = os.environ["VA_SHM_NAME"]
+    attached = voice_assistant._attach_shared_translator(shm_name) is not None
+    return shm_name, attached, voice_assistant.get_translator().translate_text(text, "es", "en")
+
+def test_preload_shared_translator():
+    """Spawned workers load the translator the parent published to shared memory"""
+    import multiprocessing
+    
+    shm = VoiceAssistant.preload_shared()
+    try:
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            results = pool.map(_shared_translator_worker, ["tengo fiebre"] * 2)
+    finally:
+        os.environ.pop("VA_SHM_NAME", None)
+        shm.close()
+        shm.unlink()
+    
+    expected = get_translator().translate_text("tengo fiebre", "es", "en")
+    assert results == [(shm.name, True, expected)] * 2
+
+# One phrase per script family, shared by the benchmark cases and performance_test
+BENCH_PHRASES = [
+    "I have chest pain",
+    "Tengo dolor de cabeza", 
+    "मुझे बुखार है",
+    "J'ai mal au ventre",
+    "У меня болит горло"
+]
 
-def performance_test():
+@pytest.mark.parametrize("phrase", BENCH_PHRASES)
+def test_bench_process(benchmark, phrase):
+    """Benchmark process_voice_input on one phrase (pytest --benchmark-only)"""
+    assistant = _get_assistant()
+    result = benchmark(assistant.process_voice_input, phrase)
+    assert result.normalized_text
+
+def performance_test(threads=1):
     """Test voice assistant performance"""
     print("\n--- Performance Tests ---")
     
+    import gc
     import time
-    assistant = VoiceAssistant()
+    assistant = _get_assistant()
     
     # Test processing speed
-    test_phrases = [
-        "I have chest pain",
-        "Tengo dolor de cabeza", 
-        "मुझे बुखार है",
-        "J'ai mal au ventre",
-        "У меня болит горло"
-    ] * 20  # 100 phrases total
-    
-    start_time = time.time()
+    base_phrases = BENCH_PHRASES
+    # Materialized before timing since every pass below iterates it
+    test_phrases = list(itertools.chain.from_iterable(itertools.repeat(base_phrases, 20)))  # 100 phrases total
     
-    for phrase in test_phrases:
+    # Warm up, then keep garbage collection pauses out of the timed regions
+    for phrase in base_phrases:
         assistant.process_voice_input(phrase)
+    gc.collect()
+    gc.disable()
+    try:
+        start_time = time.perf_counter_ns()
+        
+        for phrase in test_phrases:
+            assistant.process_voice_input(phrase)
+        
+        total_ns = time.perf_counter_ns() - start_time
+        
+        # One batch call groups the phrases by language before normalizing/translating
+        start_time = time.perf_counter_ns()
+        results = assistant.process_voice_input_batch(test_phrases)
+        batch_ns = time.perf_counter_ns() - start_time
+        
+        threaded_ns = None
+        if threads > 1:
+            start_time = time.perf_counter_ns()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                list(executor.map(assistant.process_voice_input, test_phrases))
+            threaded_ns = time.perf_counter_ns() - start_time
+        
+        # The phrase list repeats, so a memo on the raw text turns most calls into lookups
+        cached_process = functools.lru_cache(maxsize=512)(assistant.process_voice_input)
+        
+        start_time = time.perf_counter_ns()
+        
+        for phrase in test_phrases:
+            cached_process(phrase)
+        
+        memo_ns = time.perf_counter_ns() - start_time
+    finally:
+        gc.enable()
     
-    end_time = time.time()
-    total_time = end_time - start_time
+    assert len(results) == len(test_phrases)
+    total_time = total_ns / 1e9
     avg_time = total_time / len(test_phrases)
     
     print(f"Processed {len(test_phrases)} voice inputs")
-    print(f"Total time: {total_time:.2f} seconds")
-    print(f"Average time per input: {avg_time*1000:.1f} ms")
+    print(f"Total time: {total_ns/1e6:.2f} ms")
+    print(f"Average time per input: {avg_time*1000:.3f} ms")
     print(f"Throughput: {len(test_phrases)/total_time:.1f} inputs/second")
+    print(f"Batch throughput: {len(test_phrases)/(batch_ns/1e9):.1f} inputs/second")
+    if threaded_ns is not None:
+        print(f"Threaded throughput ({threads} threads): {len(test_phrases)/(threaded_ns/1e9):.1f} inputs/second")
+    print(f"Memoized throughput: {len(test_phrases)/(memo_ns/1e9):.1f} inputs/second "
+          f"({cached_process.cache_info().misses} computed, {cached_process.cache_info().hits} cached)")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Voice Assistant tests")
+    parser.add_argument("--threads", type=int, default=1,
+                        help="also time the performance test on a pool of N threads")
+    args = parser.parse_args()
+    
     print("Starting Voice Assistant Testing...")
     
-    try:
-        # Run all tests
-        test_voice_assistant()
-        test_voice_error_handling()
-        test_accessibility_features() 
-        performance_test()
-        
-        print("\n" + "="*60)
-        print("VOICE ASSISTANT TESTING COMPLETED")
-        print("="*60)
-        
-        print("✅ All voice assistant tests completed successfully!")
-        print("\nKey Features Tested:")
-        print("• Multilingual voice input processing (10 languages)")
-        print("• Automatic language detection")
-        print("• Speech synthesis data generation") 
-        print("• Voice recognition error correction")
-        print("• Emergency message translations")
-        print("• Accessibility features")
-        print("• Performance and throughput")
-        
-        print("\nVoice Assistant is ready to help illiterate users!")
-        print("Supported languages: English, Spanish, Hindi, French, Portuguese,")
-        print("Arabic, Chinese, Bengali, Russian, German")
-        
-    except Exception as e:
-        print(f"❌ Voice assistant testing failed: {e}")
-        import traceback
-        traceback.print_exc()
+    # Run all tests; under pytest each one runs on its own (python -m pytest test_voice_assistant.py)
+    run_voice_assistant_tests()
+    test_voice_error_handling(_get_assistant())
+    test_accessibility_features(_get_assistant())
+    performance_test(threads=args.threads)
+    
+    summary = [
+        "\n" + "="*60,
+        "VOICE ASSISTANT TESTING COMPLETED",
+        "="*60,
+        "✅ All voice assistant tests completed successfully!",
+        "\nKey Features Tested:",
+        "• Multilingual voice input processing (10 languages)",
+        "• Automatic language detection",
+        "• Speech synthesis data generation",
+        "• Voice recognition error correction",
+        "• Emergency message translations",
+        "• Accessibility features",
+        "• Performance and throughput",
+        "\nVoice Assistant is ready to help illiterate users!",
+        "Supported languages: English, Spanish, Hindi, French, Portuguese,",
+        "Arabic, Chinese, Bengali, Russian, German",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")